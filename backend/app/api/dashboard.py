@@ -2,6 +2,7 @@
 Dashboard API — aggregated summary data for the main dashboard.
 """
 
+import asyncio
 from datetime import datetime, timezone, timedelta
 
 from fastapi import APIRouter, Depends
@@ -51,8 +52,15 @@ async def dashboard_summary(
     if default_adapter:
         broker_connected = True
         broker_name = broker_manager.default_broker
+        # Account and positions are independent calls — fetch them together
+        info, raw_positions = await asyncio.gather(
+            default_adapter.get_account_info(),
+            default_adapter.get_positions(),
+            return_exceptions=True,
+        )
         try:
-            info = await default_adapter.get_account_info()
+            if isinstance(info, BaseException):
+                raise info
             if info:
                 account = {
                     "balance": getattr(info, "balance", 0) if not isinstance(info, dict) else info.get("balance", 0),
@@ -67,7 +75,8 @@ async def dashboard_summary(
             pass
 
         try:
-            raw_positions = await default_adapter.get_positions()
+            if isinstance(raw_positions, BaseException):
+                raise raw_positions
             positions = [
                 {
                     "position_id": str(getattr(p, "position_id", "") if not isinstance(p, dict) else p.get("position_id", "")),
@@ -43,6 +43,11 @@ class Settings(BaseSettings):
     # Databento (CME futures data — requires subscription)
     DATABENTO_API_KEY: str = ""
 
+    # Coinbase: reuse a signed CDP JWT for repeat calls to the same endpoint
+    # instead of signing one per request.  Off by default — CDP documents
+    # JWTs as single-request tokens with nonce replay protection.
+    COINBASE_JWT_REUSE: bool = False
+
     class Config:
         env_file = ".env"
 
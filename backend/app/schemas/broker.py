@@ -21,6 +21,7 @@ class BrokerStatusResponse(BaseModel):
     connected: bool
     broker_name: str
     is_default: bool
+    latency: Optional[dict[str, dict]] = None  # MT5: op → count / p50_ms / p95_ms / p99_ms
 
 
 class BrokerListResponse(BaseModel):
@@ -0,0 +1,60 @@
+"""
+Optional numba support for the backtest kernels.
+
+numba is in requirements.txt, but the import stays optional so setups
+without it (platforms with no numba wheel, minimal dev installs) still
+work.  Kernels are written as plain numeric Python and decorated with
+``njit`` from here: with numba installed they are compiled, without it the
+decorator returns the function unchanged and the same code runs in the
+interpreter.  ``USING_NUMBA`` reports which path is
+active so callers can pick array vs list inputs accordingly.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+USING_NUMBA = False
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+    USING_NUMBA = True
+except ImportError:
+    logger.info("numba not available — backtest kernels run as plain Python")
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+def warmup_kernels() -> None:
+    """
+    Compile every backtest kernel once on tiny inputs.
+
+    Kernels use ``njit(cache=True)``, so after the first process has compiled
+    them this mostly loads machine code from numba's on-disk cache.  Run at
+    server startup (off the event loop) so the first user backtest or
+    walk-forward doesn't pay the JIT cost; forked pool workers inherit the
+    compiled kernels.  No-op in a setup without numba.
+    """
+    if not USING_NUMBA:
+        return
+    try:
+        import numpy as np
+
+        from app.services.backtest.engine import Bar
+        from app.services.backtest.strategy_backtester import backtest_mss, prepare_bars
+        from app.services.backtest.walk_forward import _mean_var_welford
+
+        bars = [
+            Bar(time=1700000000 + i * 3600, open=100.0 + i % 7, high=102.0 + i % 5,
+                low=98.0 - i % 3, close=100.0 + i % 4)
+            for i in range(240)
+        ]
+        backtest_mss(prepare_bars(bars), {"swing_lb": 5})
+        _mean_var_welford(np.array([0.0, 1.0]))
+        logger.info("Backtest kernels compiled")
+    except Exception as e:
+        logger.warning("Backtest kernel warmup failed: %s", e)
@@ -9,25 +9,104 @@ producing results in the standard BacktestResult format for the UI.
     in ``app.services.backtest.v2.engine.strategies``.  The API now routes
     all strategy types via ``v2_adapter.run_unified_backtest()``.
     Kept for walk-forward / optimiser scripts until they migrate to V2.
+
+Acceleration:
+    The MSS loop lives in ``_mss_kernel``, a pure-numeric function over
+    C-contiguous float64 columns (time, high, low, close) built by
+    ``prepare_bars()``.  When numba is importable it is compiled with
+    ``njit(nogil=True)``; otherwise the same code runs as plain Python over
+    lists.  ``USING_NUMBA`` reports which path is active.  Any other
+    compiled port of the kernel should take the same column inputs and
+    return the same ``(closed, equity_curve, max_dd, max_dd_pct)`` tuple.
 """
 
 import math
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+
 from app.services.backtest.engine import Bar, Trade, BacktestResult
+from app.services.backtest.jit import USING_NUMBA, njit
 
 logger = logging.getLogger(__name__)
 
+# Exit reason codes.  The loops carry these (and the +1/-1 direction) as
+# ints; strings are only looked up when a Trade is materialised.
+EXIT_NONE = -1
+EXIT_TP2 = 0
+EXIT_TP1 = 1
+EXIT_SL = 2
+EXIT_REVERSAL = 3
+_EXIT_REASONS = ("TP2", "TP1", "SL", "Reversal")
+_DIRECTIONS = {1: "long", -1: "short"}
+
+
+@njit(cache=True)
+def _resolve_exit(hit_tp2: bool, hit_tp1: bool, hit_sl: bool) -> int:
+    """Branchless exit priority: TP2 beats SL, SL beats TP1, else EXIT_NONE."""
+    s = int(hit_sl)
+    return (1 - int(hit_tp2)) * (2 * s + (1 - s) * (2 * int(hit_tp1) - 1))
+
+
+@dataclass(frozen=True)
+class BarArrays:
+    """
+    Column view of a bar series for the MSS / Gold BT backtesters.
+
+    Build once with ``prepare_bars()`` and pass it in place of the Bar list
+    when running many configs over the same data (optimiser sweeps), so the
+    Bar → column conversion is not repeated on every call.
+    """
+    times: list[float]
+    highs: list[float]
+    lows: list[float]
+    closes: list[float]
+    # (times, highs, lows, closes) in the form the kernels run fastest on:
+    # float64 arrays under numba, the plain lists otherwise.
+    kernel_series: tuple
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+def prepare_bars(bars_raw: list[Bar]) -> BarArrays:
+    """Convert Bar objects to the column layout used by the backtest kernels."""
+    times = [b.time for b in bars_raw]
+    highs = [b.high for b in bars_raw]
+    lows = [b.low for b in bars_raw]
+    closes = [b.close for b in bars_raw]
+    if USING_NUMBA:
+        kernel_series = tuple(
+            np.ascontiguousarray(col, dtype=np.float64) for col in (times, highs, lows, closes)
+        )
+    else:
+        kernel_series = (times, highs, lows, closes)
+    return BarArrays(times, highs, lows, closes, kernel_series)
+
+
+def _as_bar_arrays(bars: list[Bar] | BarArrays) -> BarArrays:
+    return bars if isinstance(bars, BarArrays) else prepare_bars(bars)
+
 
 def compute_adr10_series(bars: list[dict]) -> list[float]:
-    """Compute rolling ADR10 for each bar (using daily ranges from M10 data)."""
+    """Compute rolling ADR10 for each bar (using daily ranges from M10 data).
+
+    Reference implementation: ``_mss_kernel`` computes the same series
+    inline, and the tests check the kernel's entries against this.
+    """
     n = len(bars)
     adr = [0.0] * n
 
-    # Build daily ranges
-    daily_ranges = []
+    # Last 10 completed daily ranges; the average only changes when a day
+    # closes, so it is recomputed there and reused for every bar of the day.
+    daily_ranges: deque[float] = deque(maxlen=10)
+    adr_value = 0.0
     day_high = bars[0]["high"]
     day_low = bars[0]["low"]
     prev_day = -1
@@ -42,6 +121,7 @@ def compute_adr10_series(bars: list[dict]) -> list[float]:
 
         if day_ord != prev_day:
             daily_ranges.append(day_high - day_low)
+            adr_value = sum(daily_ranges) / len(daily_ranges)
             day_high = bars[i]["high"]
             day_low = bars[i]["low"]
             prev_day = day_ord
@@ -49,173 +129,170 @@ def compute_adr10_series(bars: list[dict]) -> list[float]:
             day_high = max(day_high, bars[i]["high"])
             day_low = min(day_low, bars[i]["low"])
 
-        if daily_ranges:
-            last_n = daily_ranges[-10:] if len(daily_ranges) >= 10 else daily_ranges
-            adr[i] = sum(last_n) / len(last_n)
+        adr[i] = adr_value
 
     return adr
 
 
-def backtest_mss(
-    bars_raw: list[Bar],
-    mss_config: dict,
-    initial_balance: float = 10000.0,
-    spread_points: float = 0.0,
-    commission_per_lot: float = 0.0,
-    point_value: float = 1.0,
-) -> BacktestResult:
-    """
-    Run MSS backtest using the EXACT same logic as optimize_strategies.py.
+@njit(cache=True, nogil=True)
+def _mss_kernel(
+    times, highs, lows, closes,
+    lb, tp1_pct, tp2_pct, sl_pct, use_pb, pb_pct, use_close,
+    initial_balance, lot_size, point_value, trade_cost,
+):
     """
-    # Convert Bar objects to dicts
-    bars = [
-        {"time": b.time, "open": b.open, "high": b.high, "low": b.low, "close": b.close, "volume": b.volume}
-        for b in bars_raw
-    ]
+    Fused single pass over the bars: daily ADR10, pivot confirmation,
+    breakout detection and trade management.
 
-    lb = mss_config.get("swing_lb", 42)
-    tp1_pct = mss_config.get("tp1_pct", 15.0)
-    tp2_pct = mss_config.get("tp2_pct", 25.0)
-    sl_pct = mss_config.get("sl_pct", 25.0)
-    use_pb = mss_config.get("use_pullback", True)
-    pb_pct = mss_config.get("pb_pct", 0.382)
-    use_close = mss_config.get("confirm", "close") == "close"
-
-    N = len(bars)
-    min_needed = lb * 2 + 1
-    if N < min_needed:
-        return BacktestResult(total_bars=N)
-
-    highs = [b["high"] for b in bars]
-    lows = [b["low"] for b in bars]
-    closes = [b["close"] for b in bars]
-
-    # Precompute ADR10
-    adr10 = compute_adr10_series(bars)
-
-    # Detect all pivots
-    pivot_highs = [None] * N
-    pivot_lows = [None] * N
-    for i in range(lb, N - lb):
-        window_h = highs[i - lb: i + lb + 1]
-        val_h = highs[i]
-        if val_h == max(window_h) and window_h.count(val_h) == 1:
-            pivot_highs[i] = val_h
-        window_l = lows[i - lb: i + lb + 1]
-        val_l = lows[i]
-        if val_l == min(window_l) and window_l.count(val_l) == 1:
-            pivot_lows[i] = val_l
-
-    # State
-    last_high = float("nan")
-    last_low = float("nan")
+    Returns ``(closed, equity_curve, max_dd, max_dd_pct)`` where each
+    ``closed`` row is ``(entry_bar, exit_bar, direction, reason,
+    entry_price, exit_price, stop_loss, take_profit, pnl)``.
+    """
+    n = len(highs)
+    warmup = lb * 2
+
+    # ADR10: the last 10 completed daily ranges in a ring.  The average only
+    # changes when a day closes, so it is recomputed there (oldest first,
+    # matching compute_adr10_series) and reused for every bar of the day.
+    ranges = [0.0] * 10
+    n_ranges = 0
+    ranges_head = 0
+    adr = 0.0
+    day_high = highs[0]
+    day_low = lows[0]
+    prev_day = int(times[0]) // 86400
+
+    # Pivots are confirmed just-in-time: bar i - lb is a pivot high when it
+    # is the unique maximum of highs[i - 2*lb : i + 1].  Monotonic index
+    # deques (rings) over that window keep the first occurrence of the max
+    # (min) at the front; a tie shows up as an equal value in the second slot.
+    cap = warmup + 2
+    hi_q = [0] * cap
+    lo_q = [0] * cap
+    hi_head = 0
+    hi_len = 0
+    lo_head = 0
+    lo_len = 0
+
+    # Structure state — last_high/last_low are only read while their
+    # *_active flag is set, and the flag is only raised when a pivot writes
+    # the level.
+    last_high = 0.0
+    last_low = 0.0
     high_active = False
     low_active = False
-    last_break_dir = 0
 
     active_entry = 0.0
     active_sl = 0.0
     active_tp1 = 0.0
     active_tp2 = 0.0
     active_dir = 0
+    active_entry_bar = 0
 
-    trades_list: list[Trade] = []
+    closed = []
     equity_curve = [initial_balance]
     balance = initial_balance
-    lot_size = 0.01
-
-    consec_losses = 0
-    max_consec = 0
     peak_balance = initial_balance
     max_dd = 0.0
     max_dd_pct = 0.0
-    active_entry_bar = 0
-    active_entry_time = 0.0
 
-    for i in range(lb * 2, N):
+    for i in range(n):
+        h = highs[i]
+        l = lows[i]
+
+        # Daily range accumulator
+        day = int(times[i]) // 86400
+        if day != prev_day:
+            ranges[(ranges_head + n_ranges) % 10] = day_high - day_low
+            if n_ranges < 10:
+                n_ranges += 1
+            else:
+                ranges_head = (ranges_head + 1) % 10
+            total = 0.0
+            for k in range(n_ranges):
+                total += ranges[(ranges_head + k) % 10]
+            adr = total / n_ranges
+            day_high = h
+            day_low = l
+            prev_day = day
+        else:
+            day_high = max(day_high, h)
+            day_low = min(day_low, l)
+
+        # Pivot window deques
+        while hi_len > 0 and highs[hi_q[(hi_head + hi_len - 1) % cap]] < h:
+            hi_len -= 1
+        hi_q[(hi_head + hi_len) % cap] = i
+        hi_len += 1
+        while lo_len > 0 and lows[lo_q[(lo_head + lo_len - 1) % cap]] > l:
+            lo_len -= 1
+        lo_q[(lo_head + lo_len) % cap] = i
+        lo_len += 1
+
+        if i < warmup:
+            continue
+
+        window_start = i - warmup
+        if hi_q[hi_head] < window_start:
+            hi_head = (hi_head + 1) % cap
+            hi_len -= 1
+        if lo_q[lo_head] < window_start:
+            lo_head = (lo_head + 1) % cap
+            lo_len -= 1
+
         # Update pivots
         pivot_bar = i - lb
-        if pivot_bar >= 0:
-            if pivot_highs[pivot_bar] is not None:
-                last_high = pivot_highs[pivot_bar]
-                high_active = True
-            if pivot_lows[pivot_bar] is not None:
-                last_low = pivot_lows[pivot_bar]
-                low_active = True
+        if hi_q[hi_head] == pivot_bar and (
+            hi_len == 1 or highs[hi_q[(hi_head + 1) % cap]] < highs[pivot_bar]
+        ):
+            last_high = highs[pivot_bar]
+            high_active = True
+        if lo_q[lo_head] == pivot_bar and (
+            lo_len == 1 or lows[lo_q[(lo_head + 1) % cap]] > lows[pivot_bar]
+        ):
+            last_low = lows[pivot_bar]
+            low_active = True
 
         # Breakout detection
-        src_h = closes[i] if use_close else highs[i]
-        src_l = closes[i] if use_close else lows[i]
+        src_h = closes[i] if use_close else h
+        src_l = closes[i] if use_close else l
 
         bullish = False
         bearish = False
 
-        if high_active and not math.isnan(last_high) and src_h > last_high:
+        if high_active and src_h > last_high:
             bullish = True
             high_active = False
-        if low_active and not math.isnan(last_low) and src_l < last_low:
+        if low_active and src_l < last_low:
             bearish = True
             low_active = False
 
-        if bullish:
-            last_break_dir = 1
-        if bearish:
-            last_break_dir = -1
-
         # Check active trade exits
         if active_dir != 0:
-            hit_tp2 = False
-            hit_tp1 = False
-            hit_sl = False
-
             if active_dir == 1:
-                hit_tp2 = highs[i] >= active_tp2
-                hit_tp1 = highs[i] >= active_tp1
-                hit_sl = lows[i] <= active_sl
+                hit_tp2 = h >= active_tp2
+                hit_tp1 = h >= active_tp1
+                hit_sl = l <= active_sl
             else:
-                hit_tp2 = lows[i] <= active_tp2
-                hit_tp1 = lows[i] <= active_tp1
-                hit_sl = highs[i] >= active_sl
+                hit_tp2 = l <= active_tp2
+                hit_tp1 = l <= active_tp1
+                hit_sl = h >= active_sl
 
-            exit_price = None
-            exit_reason = ""
-
-            if hit_tp2:
-                exit_price = active_tp2
-                exit_reason = "TP2"
-            elif hit_tp1 and not hit_sl:
-                exit_price = active_tp1
-                exit_reason = "TP1"
-            elif hit_sl:
-                exit_price = active_sl
-                exit_reason = "SL"
-
-            if exit_price is not None:
-                pnl = abs(exit_price - active_entry) if exit_reason != "SL" else -abs(active_sl - active_entry)
-                if active_dir == -1 and exit_reason != "SL":
-                    pnl = abs(active_entry - exit_price)
-                elif active_dir == -1 and exit_reason == "SL":
-                    pnl = -(abs(active_sl - active_entry))
+            code = _resolve_exit(hit_tp2, hit_tp1, hit_sl)
+
+            if code != EXIT_NONE:
+                exit_price = (active_tp2, active_tp1, active_sl)[code]
+                # TP levels sit on the profit side of entry and SL on the loss
+                # side, so the direction-signed move already has the right sign.
+                pnl = active_dir * (exit_price - active_entry)
 
                 # Apply commission and spread
-                cost = commission_per_lot * lot_size + spread_points * point_value * lot_size
-                pnl_dollar = pnl * point_value * lot_size * 100 - cost
+                pnl_dollar = pnl * point_value * lot_size * 100 - trade_cost
                 balance += pnl_dollar
 
-                trades_list.append(Trade(
-                    entry_bar=active_entry_bar,
-                    entry_time=active_entry_time,
-                    entry_price=active_entry,
-                    direction="long" if active_dir == 1 else "short",
-                    size=lot_size,
-                    stop_loss=active_sl,
-                    take_profit=active_tp2,
-                    exit_bar=i,
-                    exit_time=bars[i]["time"],
-                    exit_price=exit_price,
-                    exit_reason=exit_reason,
-                    pnl=round(pnl_dollar, 2),
-                    pnl_pct=round(pnl_dollar / initial_balance * 100, 2),
+                closed.append((
+                    active_entry_bar, i, active_dir, code,
+                    active_entry, exit_price, active_sl, active_tp2, pnl_dollar,
                 ))
 
                 active_dir = 0
@@ -223,7 +300,7 @@ def backtest_mss(
                 if balance > peak_balance:
                     peak_balance = balance
                 dd = peak_balance - balance
-                dd_pct = dd / peak_balance * 100 if peak_balance > 0 else 0
+                dd_pct = dd / peak_balance * 100 if peak_balance > 0 else 0.0
                 if dd > max_dd:
                     max_dd = dd
                 if dd_pct > max_dd_pct:
@@ -233,9 +310,9 @@ def backtest_mss(
 
         # Signal handling
         signal_dir = 0
-        if bullish and not math.isnan(last_high):
+        if bullish:
             signal_dir = 1
-        elif bearish and not math.isnan(last_low):
+        elif bearish:
             signal_dir = -1
 
         if signal_dir == 0:
@@ -248,36 +325,23 @@ def backtest_mss(
             else:
                 rev_pnl = active_entry - closes[i]
 
-            cost = commission_per_lot * lot_size + spread_points * point_value * lot_size
-            rev_pnl_dollar = rev_pnl * point_value * lot_size * 100 - cost
+            rev_pnl_dollar = rev_pnl * point_value * lot_size * 100 - trade_cost
             balance += rev_pnl_dollar
 
-            trades_list.append(Trade(
-                entry_bar=active_entry_bar,
-                entry_time=active_entry_time,
-                entry_price=active_entry,
-                direction="long" if active_dir == 1 else "short",
-                size=lot_size,
-                stop_loss=active_sl,
-                take_profit=active_tp2,
-                exit_bar=i,
-                exit_time=bars[i]["time"],
-                exit_price=closes[i],
-                exit_reason="Reversal",
-                pnl=round(rev_pnl_dollar, 2),
-                pnl_pct=round(rev_pnl_dollar / initial_balance * 100, 2),
+            closed.append((
+                active_entry_bar, i, active_dir, EXIT_REVERSAL,
+                active_entry, closes[i], active_sl, active_tp2, rev_pnl_dollar,
             ))
 
             active_dir = 0
 
         # Open new trade
-        a = adr10[i]
-        if a <= 0:
+        if adr <= 0:
             continue
 
-        tp1_dist = a * (tp1_pct / 100.0)
-        tp2_dist = a * (tp2_pct / 100.0)
-        sl_dist = a * (sl_pct / 100.0)
+        tp1_dist = adr * (tp1_pct / 100.0)
+        tp2_dist = adr * (tp2_pct / 100.0)
+        sl_dist = adr * (sl_pct / 100.0)
         pivot = last_high if signal_dir == 1 else last_low
 
         if signal_dir == 1:
@@ -297,14 +361,84 @@ def backtest_mss(
         active_tp2 = tp2
         active_dir = signal_dir
         active_entry_bar = i
-        active_entry_time = bars[i]["time"]
+
+    return closed, equity_curve, max_dd, max_dd_pct
+
+
+def backtest_mss(
+    bars_raw: list[Bar] | BarArrays,
+    mss_config: dict,
+    initial_balance: float = 10000.0,
+    spread_points: float = 0.0,
+    commission_per_lot: float = 0.0,
+    point_value: float = 1.0,
+) -> BacktestResult:
+    """
+    Run MSS backtest using the EXACT same logic as optimize_strategies.py.
+
+    ``bars_raw`` may be a ``BarArrays`` from ``prepare_bars()`` to skip the
+    conversion when sweeping configs over the same bars.
+    """
+    lb = mss_config.get("swing_lb", 42)
+    tp1_pct = mss_config.get("tp1_pct", 15.0)
+    tp2_pct = mss_config.get("tp2_pct", 25.0)
+    sl_pct = mss_config.get("sl_pct", 25.0)
+    use_pb = mss_config.get("use_pullback", True)
+    pb_pct = mss_config.get("pb_pct", 0.382)
+    use_close = mss_config.get("confirm", "close") == "close"
+
+    N = len(bars_raw)
+    min_needed = lb * 2 + 1
+    if N < min_needed:
+        return BacktestResult(total_bars=N)
+
+    bars = _as_bar_arrays(bars_raw)
+
+    lot_size = 0.01
+    cost = commission_per_lot * lot_size + spread_points * point_value * lot_size
+
+    closed, equity_curve, max_dd, max_dd_pct = _mss_kernel(
+        *bars.kernel_series,
+        lb, float(tp1_pct), float(tp2_pct), float(sl_pct), bool(use_pb), float(pb_pct), use_close,
+        float(initial_balance), lot_size, float(point_value), float(cost),
+    )
 
     # Build stats
-    return _build_result(trades_list, equity_curve, initial_balance, N, max_dd, max_dd_pct)
+    trades_list = _materialize_trades(closed, bars.times, lot_size, initial_balance)
+    return _build_result(trades_list, list(equity_curve), initial_balance, N, max_dd, max_dd_pct)
+
+
+def backtest_mss_batch(
+    bars_raw: list[Bar] | BarArrays,
+    configs: list[dict],
+    initial_balance: float = 10000.0,
+    spread_points: float = 0.0,
+    commission_per_lot: float = 0.0,
+    point_value: float = 1.0,
+    max_workers: int = 0,
+) -> list[BacktestResult]:
+    """
+    Run ``backtest_mss`` for each config over the same bars.
+
+    The bars are converted once.  Under numba the kernel releases the GIL,
+    so configs run concurrently on a thread pool (``max_workers=0`` means
+    cpu_count - 1); without numba they run one after another.
+    """
+    bars = _as_bar_arrays(bars_raw)
+
+    def _run(cfg: dict) -> BacktestResult:
+        return backtest_mss(bars, cfg, initial_balance, spread_points, commission_per_lot, point_value)
+
+    workers = max_workers if max_workers > 0 else max(1, (os.cpu_count() or 4) - 1)
+    if not USING_NUMBA or workers <= 1 or len(configs) <= 1:
+        return [_run(cfg) for cfg in configs]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(configs))) as executor:
+        return list(executor.map(_run, configs))
 
 
 def backtest_gold_bt(
-    bars_raw: list[Bar],
+    bars_raw: list[Bar] | BarArrays,
     gold_config: dict,
     initial_balance: float = 10000.0,
     spread_points: float = 0.0,
@@ -313,11 +447,14 @@ def backtest_gold_bt(
 ) -> BacktestResult:
     """
     Run Gold BT backtest using the EXACT same logic as optimize_strategies.py.
+
+    ``bars_raw`` may be a ``BarArrays`` from ``prepare_bars()``.
     """
-    bars = [
-        {"time": b.time, "open": b.open, "high": b.high, "low": b.low, "close": b.close, "volume": b.volume}
-        for b in bars_raw
-    ]
+    bars = _as_bar_arrays(bars_raw)
+    times = bars.times
+    highs = bars.highs
+    lows = bars.lows
+    closes = bars.closes
 
     interval_h = gold_config.get("trigger_interval_hours", 2)
     box_h = gold_config.get("box_height", 10.0)
@@ -341,9 +478,9 @@ def backtest_gold_bt(
     active_tp2 = 0.0
     active_dir = 0
     active_entry_bar = 0
-    active_entry_time = 0.0
 
-    trades_list: list[Trade] = []
+    # Closed trades as raw rows; Trade objects are built once after the loop
+    closed: list[tuple] = []
     balance = initial_balance
     equity_curve = [initial_balance]
     lot_size = 0.01
@@ -354,9 +491,7 @@ def backtest_gold_bt(
 
     N = len(bars)
     for i in range(1, N):
-        bar = bars[i]
-        prev = bars[i - 1]
-        ts = int(bar["time"])
+        ts = int(times[i])
         dt = datetime.fromtimestamp(ts, tz=timezone.utc)
         h, m = dt.hour, dt.minute
 
@@ -370,7 +505,7 @@ def backtest_gold_bt(
                 last_trigger_hour = h
 
         if is_trigger:
-            ref_price = bar["close"]
+            ref_price = closes[i]
             half = box_h / 2.0
             buy_stop = ref_price + half + buffer
             sell_stop = ref_price - half - buffer
@@ -420,49 +555,28 @@ def backtest_gold_bt(
             hit_sl = False
 
             if active_dir == 1:
-                hit_tp2 = bar["high"] >= active_tp2
-                hit_tp1 = bar["high"] >= active_tp1
-                hit_sl = bar["low"] <= active_sl
+                hit_tp2 = highs[i] >= active_tp2
+                hit_tp1 = highs[i] >= active_tp1
+                hit_sl = lows[i] <= active_sl
             else:
-                hit_tp2 = bar["low"] <= active_tp2
-                hit_tp1 = bar["low"] <= active_tp1
-                hit_sl = bar["high"] >= active_sl
-
-            exit_price = None
-            exit_reason = ""
-
-            if hit_tp2:
-                exit_price = active_tp2
-                exit_reason = "TP2"
-                pnl = abs(active_tp2 - active_entry)
-            elif hit_tp1 and not hit_sl:
-                exit_price = active_tp1
-                exit_reason = "TP1"
-                pnl = abs(active_tp1 - active_entry)
-            elif hit_sl:
-                exit_price = active_sl
-                exit_reason = "SL"
-                pnl = -abs(active_sl - active_entry)
-
-            if exit_price is not None:
+                hit_tp2 = lows[i] <= active_tp2
+                hit_tp1 = lows[i] <= active_tp1
+                hit_sl = highs[i] >= active_sl
+
+            code = _resolve_exit(hit_tp2, hit_tp1, hit_sl)
+
+            if code != EXIT_NONE:
+                exit_price = (active_tp2, active_tp1, active_sl)[code]
+                pnl = abs(exit_price - active_entry)
+                if code == EXIT_SL:
+                    pnl = -pnl
                 cost = commission_per_lot * lot_size + spread_points * point_value * lot_size
                 pnl_dollar = pnl * point_value * lot_size * 100 - cost
                 balance += pnl_dollar
 
-                trades_list.append(Trade(
-                    entry_bar=active_entry_bar,
-                    entry_time=active_entry_time,
-                    entry_price=active_entry,
-                    direction="long" if active_dir == 1 else "short",
-                    size=lot_size,
-                    stop_loss=active_sl,
-                    take_profit=active_tp2,
-                    exit_bar=i,
-                    exit_time=bar["time"],
-                    exit_price=exit_price,
-                    exit_reason=exit_reason,
-                    pnl=round(pnl_dollar, 2),
-                    pnl_pct=round(pnl_dollar / initial_balance * 100, 2),
+                closed.append((
+                    active_entry_bar, i, active_dir, code,
+                    active_entry, exit_price, active_sl, active_tp2, pnl_dollar,
                 ))
 
                 active_dir = 0
@@ -481,8 +595,8 @@ def backtest_gold_bt(
                 continue
 
         # Check for new entries
-        prev_close = prev["close"]
-        curr_close = bar["close"]
+        prev_close = closes[i - 1]
+        curr_close = closes[i]
 
         new_signal = 0
         if prev_close <= buy_stop and curr_close > buy_stop:
@@ -502,20 +616,9 @@ def backtest_gold_bt(
                 pnl_dollar = pnl_rev * point_value * lot_size * 100 - cost
                 balance += pnl_dollar
 
-                trades_list.append(Trade(
-                    entry_bar=active_entry_bar,
-                    entry_time=active_entry_time,
-                    entry_price=active_entry,
-                    direction="long" if active_dir == 1 else "short",
-                    size=lot_size,
-                    stop_loss=active_sl,
-                    take_profit=active_tp2,
-                    exit_bar=i,
-                    exit_time=bar["time"],
-                    exit_price=curr_close,
-                    exit_reason="Reversal",
-                    pnl=round(pnl_dollar, 2),
-                    pnl_pct=round(pnl_dollar / initial_balance * 100, 2),
+                closed.append((
+                    active_entry_bar, i, active_dir, EXIT_REVERSAL,
+                    active_entry, curr_close, active_sl, active_tp2, pnl_dollar,
                 ))
                 active_dir = 0
 
@@ -527,13 +630,47 @@ def backtest_gold_bt(
             active_tp2 = tp2
             active_dir = new_signal
             active_entry_bar = i
-            active_entry_time = bar["time"]
 
         equity_curve.append(balance)
 
+    trades_list = _materialize_trades(closed, times, lot_size, initial_balance)
     return _build_result(trades_list, equity_curve, initial_balance, N, max_dd, max_dd_pct)
 
 
+def _materialize_trades(
+    closed: list[tuple],
+    times: list[float],
+    lot_size: float,
+    initial_balance: float,
+) -> list[Trade]:
+    """
+    Build Trade objects from the raw rows recorded by the backtest loops.
+
+    The loops keep unrounded dollar pnl; rounding to cents happens only
+    here, once per trade.  ``float()`` keeps Python's correctly-rounded
+    ``round`` even if a kernel hands back numpy scalars.
+    """
+    return [
+        Trade(
+            entry_bar=entry_bar,
+            entry_time=times[entry_bar],
+            entry_price=entry_price,
+            direction=_DIRECTIONS[direction],
+            size=lot_size,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            exit_bar=exit_bar,
+            exit_time=times[exit_bar],
+            exit_price=exit_price,
+            exit_reason=_EXIT_REASONS[reason],
+            pnl=round(float(pnl), 2),
+            pnl_pct=round(float(pnl) / initial_balance * 100, 2),
+        )
+        for (entry_bar, exit_bar, direction, reason,
+             entry_price, exit_price, stop_loss, take_profit, pnl) in closed
+    ]
+
+
 def _build_result(
     trades: list[Trade],
     equity_curve: list[float],
@@ -552,40 +689,44 @@ def _build_result(
     if not trades:
         return result
 
-    result.total_trades = len(trades)
-    wins = [t for t in trades if t.pnl > 0]
-    losses = [t for t in trades if t.pnl <= 0]
-
-    result.winning_trades = len(wins)
-    result.losing_trades = len(losses)
-    result.win_rate = len(wins) / len(trades) * 100 if trades else 0
-
-    result.gross_profit = sum(t.pnl for t in wins) if wins else 0
-    result.gross_loss = abs(sum(t.pnl for t in losses)) if losses else 0
+    n = len(trades)
+    pnls = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=n)
+    win_mask = pnls > 0
+    wins = pnls[win_mask]
+    losses = pnls[~win_mask]
+    n_wins = len(wins)
+    n_losses = n - n_wins
+
+    result.total_trades = n
+    result.winning_trades = n_wins
+    result.losing_trades = n_losses
+    result.win_rate = n_wins / n * 100
+
+    result.gross_profit = float(wins.sum()) if n_wins else 0
+    result.gross_loss = abs(float(losses.sum())) if n_losses else 0
     result.net_profit = result.gross_profit - result.gross_loss
 
     result.profit_factor = result.gross_profit / result.gross_loss if result.gross_loss > 0 else 999.0
 
-    result.avg_win = result.gross_profit / len(wins) if wins else 0
-    result.avg_loss = -result.gross_loss / len(losses) if losses else 0
-    result.largest_win = max(t.pnl for t in wins) if wins else 0
-    result.largest_loss = min(t.pnl for t in losses) if losses else 0
+    result.avg_win = result.gross_profit / n_wins if n_wins else 0
+    result.avg_loss = -result.gross_loss / n_losses if n_losses else 0
+    result.largest_win = float(wins.max()) if n_wins else 0
+    result.largest_loss = float(losses.min()) if n_losses else 0
 
-    result.avg_trade = result.net_profit / len(trades) if trades else 0
+    result.avg_trade = result.net_profit / n
     result.expectancy = result.avg_trade
 
     result.max_drawdown = max_dd
     result.max_drawdown_pct = max_dd_pct
 
     # Sharpe ratio (simplified)
-    if len(trades) > 1:
-        pnls = [t.pnl for t in trades]
-        mean_pnl = sum(pnls) / len(pnls)
-        variance = sum((p - mean_pnl) ** 2 for p in pnls) / (len(pnls) - 1)
+    if n > 1:
+        mean_pnl = float(pnls.mean())
+        variance = float(pnls.var(ddof=1))
         std = math.sqrt(variance) if variance > 0 else 1
         result.sharpe_ratio = (mean_pnl / std) * math.sqrt(252) if std > 0 else 0
         # SQN = (mean / std) * sqrt(N) — Van Tharp formula
-        result.sqn = round((mean_pnl / std) * math.sqrt(len(trades)), 4) if std > 0 else 0.0
+        result.sqn = round((mean_pnl / std) * math.sqrt(n), 4) if std > 0 else 0.0
 
     # Yearly PnL breakdown
     yearly: dict[str, float] = {}
@@ -593,9 +734,10 @@ def _build_result(
         if t.exit_time:
             try:
                 year = str(datetime.fromtimestamp(t.exit_time, tz=timezone.utc).year)
-                yearly[year] = round(yearly.get(year, 0.0) + t.pnl, 2)
+                yearly[year] = yearly.get(year, 0.0) + t.pnl
             except Exception:
                 pass
+    yearly = {year: round(total, 2) for year, total in yearly.items()}
     result.yearly_pnl = yearly
     result.negative_years = sum(1 for v in yearly.values() if v < 0)
 
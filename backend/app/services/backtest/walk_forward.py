@@ -10,19 +10,81 @@ Two modes:
 
 Phase 6D: Generalised to ALL strategy types via V2 unified runner.
 Previously only supported MSS and Gold BT.
+
+In-sample (train) backtests are independent of each other and are fanned
+out to a process pool; out-of-sample (test) backtests stay sequential in
+the calling process because each one starts from the previous fold's
+closing balance.
 """
 
+import hashlib
+import json
 import math
 import logging
-from dataclasses import dataclass, field
-from typing import Optional
-
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from app.core.config import settings
 from app.services.backtest.engine import Bar, Trade, BacktestResult
+from app.services.backtest.jit import USING_NUMBA, njit
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# In-sample stats keyed by (bars digest, train window, strategy, config,
+# costs, symbol).  Re-running walk-forward over the same data and config
+# (UI re-runs, n_folds tweaks that reproduce a window) skips those train
+# backtests entirely.
+_TRAIN_STATS_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_TRAIN_STATS_CACHE_SIZE = 256
+_train_cache_lock = threading.Lock()
+
+# On-disk WFResult cache (use_cache=True): one JSON file per input hash,
+# expired after _WF_CACHE_TTL_SECONDS and trimmed to the most recently used
+# entries.  JSON rather than pickle, so a file planted in the cache directory
+# can at worst fail to load, never run code.
+_WF_CACHE_DIR = Path(settings.UPLOAD_DIR).parent / "cache" / "walk_forward"
+_WF_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_WF_CACHE_MAX_ENTRIES = 128
+
+# Decimal places for stats fields in the returned WFResult.  Stats stay at
+# full precision while folds run and are rounded once by _round_output.
+ROUND_SPECS = {
+    "win_rate": 2,
+    "net_profit": 2,
+    "profit_factor": 4,
+    "max_drawdown": 2,
+    "max_drawdown_pct": 2,
+    "sharpe_ratio": 4,
+    "expectancy": 2,
+}
+
+# Column order of the struct-of-arrays bar view; matches Bar's fields so a
+# row can be passed straight back to Bar(*row).
+_SOA_FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+# Set in each pool worker by _init_worker: the full bar series as columns,
+# shipped once per worker so tasks only carry (start, end) ranges.
+_WORKER_SOA: Optional[dict[str, np.ndarray]] = None
+
+
+class FoldMetrics(NamedTuple):
+    """Per-fold OOS figures feeding the consistency lists on WFResult."""
+    win_rate: float
+    profit_factor: float
+    net_profit: float
+
+
+@dataclass(slots=True)
 class WFWindow:
     """A single walk-forward window."""
     fold: int
@@ -33,11 +95,13 @@ class WFWindow:
     # Results
     train_stats: Optional[dict] = None
     test_stats: Optional[dict] = None
-    test_trades: list = field(default_factory=list)
-    test_equity: list = field(default_factory=list)
+    fold_metrics: Optional[FoldMetrics] = None
+    # Set from the fold's test run; None until then
+    test_trades: Optional[list] = None
+    test_equity: Optional[list] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WFResult:
     """Walk-forward validation result."""
     n_folds: int = 0
@@ -77,6 +141,10 @@ def walk_forward_backtest(
     commission_per_lot: float = 0.0,
     point_value: float = 1.0,
     symbol: str = "UNKNOWN",
+    max_workers: int = 1,
+    skip_train_stats: bool = False,
+    equity_downsample: int = 1,
+    use_cache: bool = False,
 ) -> WFResult:
     """
     Run walk-forward validation.
@@ -94,6 +162,14 @@ def walk_forward_backtest(
         initial_balance: Starting balance
         spread_points, commission_per_lot, point_value: Cost parameters
         symbol: Trading symbol (for V2 instrument spec)
+        max_workers: Processes for the in-sample runs (1 = run everything
+            in this process, the default; 0 = cpu_count - 1)
+        skip_train_stats: Don't run the in-sample backtests at all; every
+            window's ``train_stats`` stays None
+        equity_downsample: Keep every n-th point of ``oos_equity_curve``
+            (plus the final point). Drawdown is still measured on every point.
+        use_cache: Load / store the whole WFResult in the on-disk cache,
+            keyed by a hash of the bars and every argument above
 
     Returns:
         WFResult with per-fold and aggregated OOS statistics
@@ -102,110 +178,175 @@ def walk_forward_backtest(
     if N < 200:
         raise ValueError(f"Need at least 200 bars for walk-forward, got {N}")
 
+    soa = _bars_to_soa(bars)
+    digest = _bars_digest(soa)
+
+    cache_key = None
+    if use_cache:
+        cache_key = _wf_cache_key(
+            digest, strategy_type, strategy_config, n_folds, train_pct, mode,
+            initial_balance, spread_points, commission_per_lot, point_value,
+            symbol, skip_train_stats, equity_downsample,
+        )
+        cached = _wf_cache_load(cache_key)
+        if cached is not None:
+            logger.info("Walk-Forward cache hit (%s)", cache_key[:12])
+            return cached
+
     # Calculate window boundaries
     windows = _calculate_windows(N, n_folds, train_pct, mode)
 
     result = WFResult(n_folds=n_folds)
-    all_oos_trades: list[Trade] = []
+    fold_trades: list[list[Trade]] = []
     running_balance = initial_balance
-    oos_equity = [initial_balance]
-
-    peak_balance = initial_balance
-    max_dd = 0.0
-    max_dd_pct = 0.0
-
-    for w in windows:
-        logger.info(
-            "WF Fold %d: train[%d:%d] (%d bars) → test[%d:%d] (%d bars)",
-            w.fold, w.train_start, w.train_end, w.train_end - w.train_start,
-            w.test_start, w.test_end, w.test_end - w.test_start,
-        )
-
-        train_bars = bars[w.train_start:w.train_end]
-        test_bars = bars[w.test_start:w.test_end]
-
-        # Run in-sample backtest (for reference stats only)
-        train_result = _run_backtest(
-            train_bars, strategy_type, strategy_config,
-            initial_balance, spread_points, commission_per_lot, point_value,
-            symbol=symbol,
+    # One float64 slot per OOS bar plus the opening balance; grown only if
+    # the runner emits more equity points than bars.
+    oos_equity = np.empty(sum(w.test_end - w.test_start for w in windows) + 1)
+    oos_equity[0] = initial_balance
+    cursor = 1
+    # Per-fold OOS metrics, written by fold index
+    fold_win_rates = np.empty(len(windows))
+    fold_profit_factors = np.empty(len(windows))
+    fold_net_profits = np.empty(len(windows))
+
+    config_key = _freeze(strategy_config)
+    costs = (initial_balance, spread_points, commission_per_lot, point_value)
+    # Resolve the config wrapper and freeze costs once; every segment after
+    # this only varies by bars and starting balance.
+    run_segment = partial(
+        _run_backtest,
+        strategy_config=_resolve_strategy_config(strategy_type, strategy_config),
+        spread_points=spread_points,
+        commission_per_lot=commission_per_lot,
+        point_value=point_value,
+        symbol=symbol,
+    )
+    train_keys = [
+        (digest, w.train_start, w.train_end, strategy_type, config_key, costs, symbol)
+        for w in windows
+    ]
+    cached_train = [None if skip_train_stats else _train_cache_get(k) for k in train_keys]
+    pending = [] if skip_train_stats else [
+        i for i, stats in enumerate(cached_train) if stats is None
+    ]
+
+    workers = max_workers if max_workers > 0 else max(1, (os.cpu_count() or 4) - 1)
+    workers = min(workers, len(pending))
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(soa,),
         )
-        w.train_stats = _result_to_stats(train_result)
+        if workers > 1 else None
+    )
 
-        # Run out-of-sample backtest (this is the real test)
-        test_result = _run_backtest(
-            test_bars, strategy_type, strategy_config,
-            running_balance, spread_points, commission_per_lot, point_value,
-            symbol=symbol,
-        )
-        w.test_stats = _result_to_stats(test_result)
-        w.test_trades = test_result.trades
-        w.test_equity = test_result.equity_curve
-
-        # Accumulate OOS trades
-        all_oos_trades.extend(test_result.trades)
-
-        # Track running balance and equity
-        if test_result.equity_curve:
-            for eq_val in test_result.equity_curve[1:]:
-                delta = eq_val - test_result.equity_curve[0]
-                current = running_balance + delta
-                oos_equity.append(current)
-
-                if current > peak_balance:
-                    peak_balance = current
-                dd = peak_balance - current
-                dd_pct = dd / peak_balance * 100 if peak_balance > 0 else 0
-                if dd > max_dd:
-                    max_dd = dd
-                if dd_pct > max_dd_pct:
-                    max_dd_pct = dd_pct
-
-            running_balance += test_result.net_profit
-
-        # Per-fold metrics
-        result.fold_win_rates.append(w.test_stats.get("win_rate", 0))
-        result.fold_profit_factors.append(w.test_stats.get("profit_factor", 0))
-        result.fold_net_profits.append(w.test_stats.get("net_profit", 0))
-
-        result.windows.append(w)
+    try:
+        # In-sample runs only need initial_balance, so they can all start now
+        # and overlap with the sequential out-of-sample chain below.
+        train_futures = {
+            i: executor.submit(
+                _train_stats_range, run_segment,
+                windows[i].train_start, windows[i].train_end, initial_balance,
+            )
+            for i in pending
+        } if executor else {}
+
+        for i, w in enumerate(windows):
+            logger.info(
+                "WF Fold %d: train[%d:%d] (%d bars) → test[%d:%d] (%d bars)",
+                w.fold, w.train_start, w.train_end, w.train_end - w.train_start,
+                w.test_start, w.test_end, w.test_end - w.test_start,
+            )
+            train_stats, test_result = _run_fold(
+                bars, w, run_segment, initial_balance, running_balance,
+                train_stats=cached_train[i],
+                train_future=train_futures.get(i),
+                skip_train=skip_train_stats,
+            )
+            if train_stats is not None:
+                if cached_train[i] is None:
+                    _train_cache_put(train_keys[i], train_stats)
+                w.train_stats = dict(train_stats)
+            w.test_stats = _result_to_stats(test_result)
+            w.fold_metrics = FoldMetrics(
+                w.test_stats["win_rate"],
+                w.test_stats["profit_factor"],
+                w.test_stats["net_profit"],
+            )
+            w.test_trades = test_result.trades
+            w.test_equity = test_result.equity_curve
+
+            # Accumulate OOS trades
+            fold_trades.append(test_result.trades)
+
+            # Track running balance and equity
+            if test_result.equity_curve:
+                equity = np.asarray(test_result.equity_curve, dtype=np.float64)
+                needed = cursor + len(equity) - 1
+                if needed > len(oos_equity):
+                    oos_equity = np.concatenate((oos_equity, np.empty(needed - len(oos_equity))))
+                # Rebase onto the running balance; drawdown is measured once
+                # over the whole stitched curve below.
+                oos_equity[cursor:needed] = running_balance + (equity[1:] - equity[0])
+                cursor = needed
+                running_balance += test_result.net_profit
+
+            # Per-fold metrics
+            fold_win_rates[i], fold_profit_factors[i], fold_net_profits[i] = w.fold_metrics
+
+            result.windows.append(w)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Aggregate OOS statistics
-    result.oos_equity_curve = oos_equity
+    curve = oos_equity[:cursor]
+    max_dd, max_dd_pct = _max_drawdown(curve)
+    if equity_downsample > 1:
+        tail = curve[-1:] if (cursor - 1) % equity_downsample else curve[:0]
+        curve = np.concatenate((curve[::equity_downsample], tail))
+    result.oos_equity_curve = curve.tolist()
+    # One allocation at the final size instead of growing across folds
+    all_oos_trades = list(chain.from_iterable(fold_trades))
     result.oos_trades = all_oos_trades
     result.oos_max_drawdown = round(max_dd, 2)
     result.oos_max_drawdown_pct = round(max_dd_pct, 2)
 
     if all_oos_trades:
-        wins = [t for t in all_oos_trades if t.pnl > 0]
-        losses = [t for t in all_oos_trades if t.pnl <= 0]
-
-        result.oos_total_trades = len(all_oos_trades)
-        result.oos_winning_trades = len(wins)
-        result.oos_losing_trades = len(losses)
-        result.oos_win_rate = round(len(wins) / len(all_oos_trades) * 100, 2)
-
-        gross_profit = sum(t.pnl for t in wins) if wins else 0
-        gross_loss = abs(sum(t.pnl for t in losses)) if losses else 0
+        n_trades = len(all_oos_trades)
+        pnls = np.fromiter((t.pnl for t in all_oos_trades), dtype=np.float64, count=n_trades)
+        win_mask = pnls > 0
+        n_wins = int(np.count_nonzero(win_mask))
+        n_losses = n_trades - n_wins
+
+        result.oos_total_trades = n_trades
+        result.oos_winning_trades = n_wins
+        result.oos_losing_trades = n_losses
+        result.oos_win_rate = round(n_wins / n_trades * 100, 2)
+
+        gross_profit = float(pnls[win_mask].sum())
+        gross_loss = abs(float(pnls[~win_mask].sum()))
         result.oos_net_profit = round(gross_profit - gross_loss, 2)
         result.oos_profit_factor = round(
             gross_profit / gross_loss if gross_loss > 0 else 999.0, 4
         )
 
-        result.oos_avg_win = round(gross_profit / len(wins), 2) if wins else 0
-        result.oos_avg_loss = round(-gross_loss / len(losses), 2) if losses else 0
-        result.oos_expectancy = round(result.oos_net_profit / len(all_oos_trades), 2)
+        result.oos_avg_win = round(gross_profit / n_wins, 2) if n_wins else 0
+        result.oos_avg_loss = round(-gross_loss / n_losses, 2) if n_losses else 0
+        result.oos_expectancy = round(result.oos_net_profit / n_trades, 2)
 
         # Sharpe
-        if len(all_oos_trades) > 1:
-            pnls = [t.pnl for t in all_oos_trades]
-            mean_pnl = sum(pnls) / len(pnls)
-            variance = sum((p - mean_pnl) ** 2 for p in pnls) / (len(pnls) - 1)
+        if n_trades > 1:
+            mean_pnl, variance = _mean_var_welford(pnls if USING_NUMBA else pnls.tolist())
             std = math.sqrt(variance) if variance > 0 else 1
             result.oos_sharpe_ratio = round((mean_pnl / std) * math.sqrt(252), 4) if std > 0 else 0
 
+    result.fold_win_rates = fold_win_rates.tolist()
+    result.fold_profit_factors = fold_profit_factors.tolist()
+    result.fold_net_profits = fold_net_profits.tolist()
+    _round_output(result)
+
     # Consistency: % of folds with positive net profit
-    profitable_folds = sum(1 for p in result.fold_net_profits if p > 0)
+    profitable_folds = int(np.count_nonzero(np.asarray(result.fold_net_profits) > 0))
     result.consistency_score = round(profitable_folds / n_folds * 100, 1) if n_folds > 0 else 0
 
     logger.info(
@@ -214,14 +355,40 @@ def walk_forward_backtest(
         result.oos_profit_factor, result.consistency_score,
     )
 
+    if cache_key is not None:
+        _wf_cache_store(cache_key, result)
     return result
 
 
+@njit(cache=True)
+def _mean_var_welford(values) -> tuple[float, float]:
+    """Mean and sample variance (ddof=1) in one pass (Welford). Needs >= 2 values."""
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return mean, m2 / (n - 1)
+
+
+def _max_drawdown(equity: np.ndarray) -> tuple[float, float]:
+    """Max drawdown (absolute, %) of an equity curve against its running peak."""
+    peak = np.maximum.accumulate(equity)
+    dd = peak - equity
+    dd_pct = np.zeros_like(dd)
+    np.divide(dd, peak, out=dd_pct, where=peak > 0)
+    dd_pct *= 100
+    return float(dd.max()), float(dd_pct.max())
+
+
 def _calculate_windows(
     n_bars: int, n_folds: int, train_pct: float, mode: str
 ) -> list[WFWindow]:
     """Calculate train/test window boundaries for each fold."""
-    windows = []
+    folds = np.arange(n_folds, dtype=np.int64)
 
     if mode == "anchored":
         # Anchored: train always starts at 0, test window slides forward
@@ -229,63 +396,235 @@ def _calculate_windows(
         # Fold 1: train on seg[0:1], test on seg[1:2]
         # Fold 2: train on seg[0:2], test on seg[2:3]
         # etc.
-        segment_size = n_bars // (n_folds + 1)
-        for fold in range(n_folds):
-            train_start = 0
-            train_end = segment_size * (fold + 1)
-            test_start = train_end
-            test_end = min(train_end + segment_size, n_bars)
-            if test_end <= test_start:
-                continue
-            windows.append(WFWindow(
-                fold=fold + 1,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-            ))
+        test_size = n_bars // (n_folds + 1)
+        train_starts = np.zeros_like(folds)
+        train_ends = test_size * (folds + 1)
     else:
         # Rolling: fixed-size train window slides forward
         total_per_fold = n_bars // n_folds
         train_size = int(total_per_fold * train_pct / 100)
         test_size = total_per_fold - train_size
+        train_starts = folds * test_size
+        train_ends = train_starts + train_size
+
+    # Test window follows its train window, clipped to the data
+    test_ends = np.minimum(train_ends + test_size, n_bars)
+    keep = (test_ends > train_ends) & (train_ends <= n_bars)
+
+    return [
+        WFWindow(
+            fold=fold + 1,
+            train_start=train_start,
+            train_end=train_end,
+            test_start=train_end,
+            test_end=test_end,
+        )
+        for fold, train_start, train_end, test_end in zip(
+            folds[keep].tolist(), train_starts[keep].tolist(),
+            train_ends[keep].tolist(), test_ends[keep].tolist(),
+        )
+    ]
 
-        for fold in range(n_folds):
-            train_start = fold * test_size
-            train_end = train_start + train_size
-            test_start = train_end
-            test_end = min(test_start + test_size, n_bars)
-            if test_end <= test_start or train_end > n_bars:
-                continue
-            windows.append(WFWindow(
-                fold=fold + 1,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-            ))
 
-    return windows
+def _init_worker(soa: dict[str, np.ndarray]) -> None:
+    """Import the V2 runner and keep the bar columns, once per worker process."""
+    global _WORKER_SOA
+    import app.services.backtest.v2_adapter  # noqa: F401
+    _WORKER_SOA = soa
 
 
-def _run_backtest(
+def _run_fold(
     bars: list[Bar],
+    w: WFWindow,
+    run_segment: Callable[[list[Bar], float], BacktestResult],
+    initial_balance: float,
+    running_balance: float,
+    train_stats: Optional[dict] = None,
+    train_future=None,
+    skip_train: bool = False,
+) -> tuple[Optional[dict], BacktestResult]:
+    """Run one fold's test backtest and resolve its train stats.
+
+    The test segment starts from ``running_balance`` (the previous fold's
+    closing balance); the train segment always starts from
+    ``initial_balance``. ``train_stats`` (a cache hit) or ``train_future``
+    (a run already submitted to the process pool) short-circuit the train
+    backtest; ``skip_train`` drops it and returns None for the stats.
+    """
+    test_result = run_segment(bars[w.test_start:w.test_end], running_balance)
+    if train_stats is None and not skip_train:
+        if train_future is not None:
+            train_stats = train_future.result()
+        else:
+            train_stats = _train_stats(
+                run_segment, bars[w.train_start:w.train_end], initial_balance,
+            )
+    return train_stats, test_result
+
+
+def _train_stats(
+    run_segment: Callable[[list[Bar], float], BacktestResult],
+    bars: list[Bar],
+    initial_balance: float,
+) -> dict:
+    """Run an in-sample backtest and keep only its stats dict.
+
+    Pool workers return this instead of the full BacktestResult so the
+    trade list never has to be pickled back to the parent.
+    """
+    return _result_to_stats(run_segment(bars, initial_balance))
+
+
+def _train_stats_range(
+    run_segment: Callable[[list[Bar], float], BacktestResult],
+    start: int,
+    end: int,
+    initial_balance: float,
+) -> dict:
+    """Pool task: ``_train_stats`` over ``bars[start:end]`` of the worker's columns."""
+    return _train_stats(run_segment, _soa_to_bars(_WORKER_SOA, start, end), initial_balance)
+
+
+def _bars_to_soa(bars: list[Bar]) -> dict[str, np.ndarray]:
+    """Convert a Bar list to contiguous float64 columns keyed by field name."""
+    rows = np.array(
+        [(b.time, b.open, b.high, b.low, b.close, b.volume) for b in bars],
+        dtype=np.float64,
+    ).reshape(len(bars), len(_SOA_FIELDS))
+    return {name: np.ascontiguousarray(rows[:, i]) for i, name in enumerate(_SOA_FIELDS)}
+
+
+def _soa_to_bars(soa: dict[str, np.ndarray], start: int, end: int) -> list[Bar]:
+    """Rebuild ``bars[start:end]`` from column views (no column copy)."""
+    cols = [soa[name][start:end].tolist() for name in _SOA_FIELDS]
+    return [Bar(*row) for row in zip(*cols)]
+
+
+def _bars_digest(soa: dict[str, np.ndarray]) -> str:
+    """Content hash of a bar series (as columns), used in cache keys."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in _SOA_FIELDS:
+        h.update(soa[name].tobytes())
+    return h.hexdigest()
+
+
+def _wf_cache_key(
+    digest: str,
     strategy_type: str,
-    config: dict,
+    strategy_config: dict,
+    n_folds: int,
+    train_pct: float,
+    mode: str,
     initial_balance: float,
     spread_points: float,
     commission_per_lot: float,
     point_value: float,
-    symbol: str = "UNKNOWN",
-) -> BacktestResult:
-    """Run a single backtest segment via V2 unified runner (Phase 6D).
-
-    All strategy types are routed through run_unified_backtest which
-    detects MSS/Gold BT/builder from the config dict.
+    symbol: str,
+    skip_train_stats: bool,
+    equity_downsample: int,
+) -> str:
+    """SHA-256 over the bars digest and every input that shapes a WFResult."""
+    payload = json.dumps({
+        "bars": digest,
+        "strategy": strategy_type,
+        "config": strategy_config,
+        "n_folds": n_folds,
+        "train_pct": train_pct,
+        "mode": mode,
+        "initial_balance": initial_balance,
+        "costs": [spread_points, commission_per_lot, point_value],
+        "symbol": symbol,
+        "skip_train_stats": skip_train_stats,
+        "equity_downsample": equity_downsample,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _wf_result_to_json(result: WFResult) -> dict:
+    """WFResult → JSON-safe dict (Trades become dicts, FoldMetrics lists)."""
+    return asdict(result)
+
+
+def _wf_result_from_json(data: dict) -> WFResult:
+    """Inverse of _wf_result_to_json."""
+    windows = []
+    for w in data.pop("windows"):
+        if w["test_trades"] is not None:
+            w["test_trades"] = [Trade(**t) for t in w["test_trades"]]
+        if w["fold_metrics"] is not None:
+            w["fold_metrics"] = FoldMetrics(*w["fold_metrics"])
+        windows.append(WFWindow(**w))
+    data["oos_trades"] = [Trade(**t) for t in data["oos_trades"]]
+    return WFResult(windows=windows, **data)
+
+
+def _wf_cache_load(key: str) -> Optional[WFResult]:
+    path = _WF_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > _WF_CACHE_TTL_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        with open(path, "rb") as f:
+            result = _wf_result_from_json(json.load(f))
+        os.utime(path)  # LRU: mark as recently used
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Walk-Forward cache entry %s unreadable: %s", path.name, e)
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _wf_cache_store(key: str, result: WFResult) -> None:
+    try:
+        _WF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _WF_CACHE_DIR / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(_wf_result_to_json(result), f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+        entries = sorted(_WF_CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-_WF_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Walk-Forward cache write failed: %s", e)
+
+
+def _freeze(value):
+    """Recursively turn dicts / lists into tuples so a config can be hashed.
+
+    Used for the in-memory train cache key; the on-disk key hashes JSON
+    instead because ``hash()`` of strings differs between processes.
     """
-    from app.services.backtest.v2_adapter import run_unified_backtest, v2_result_to_v1
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _train_cache_get(key: tuple) -> Optional[dict]:
+    with _train_cache_lock:
+        stats = _TRAIN_STATS_CACHE.get(key)
+        if stats is not None:
+            _TRAIN_STATS_CACHE.move_to_end(key)
+        return stats
 
-    # Build a full strategy config wrapper if only sub-config was passed
+
+def _train_cache_put(key: tuple, stats: dict) -> None:
+    with _train_cache_lock:
+        _TRAIN_STATS_CACHE[key] = stats
+        _TRAIN_STATS_CACHE.move_to_end(key)
+        while len(_TRAIN_STATS_CACHE) > _TRAIN_STATS_CACHE_SIZE:
+            _TRAIN_STATS_CACHE.popitem(last=False)
+
+
+def _resolve_strategy_config(strategy_type: str, config: dict) -> dict:
+    """Build a full strategy config wrapper if only a sub-config was passed."""
     strategy_config = dict(config)
     if strategy_type == "mss" and "filters" not in strategy_config:
         # Legacy caller passed mss_config directly — wrap it
@@ -304,6 +643,26 @@ def _run_backtest(
             "risk_params": config.get("risk_params", {}),
             "filters": {"gold_bt_config": config},
         }
+    return strategy_config
+
+
+def _run_backtest(
+    bars: list[Bar],
+    initial_balance: float,
+    strategy_config: dict,
+    spread_points: float,
+    commission_per_lot: float,
+    point_value: float,
+    symbol: str = "UNKNOWN",
+) -> BacktestResult:
+    """Run a single backtest segment via V2 unified runner (Phase 6D).
+
+    All strategy types are routed through run_unified_backtest which
+    detects MSS/Gold BT/builder from the (already resolved) config dict.
+    ``walk_forward_backtest`` binds everything but the bars and balance
+    once with ``functools.partial``.
+    """
+    from app.services.backtest.v2_adapter import run_unified_backtest, v2_result_to_v1
 
     v2_result = run_unified_backtest(
         bars=bars,
@@ -318,16 +677,38 @@ def _run_backtest(
 
 
 def _result_to_stats(result: BacktestResult) -> dict:
-    """Convert BacktestResult to a stats dict."""
+    """Convert BacktestResult to a full-precision stats dict.
+
+    Rounding to ``ROUND_SPECS`` happens once, in ``_round_output``.
+    """
     return {
         "total_trades": result.total_trades,
         "winning_trades": result.winning_trades,
         "losing_trades": result.losing_trades,
-        "win_rate": round(result.win_rate, 2),
-        "net_profit": round(result.net_profit, 2),
-        "profit_factor": round(result.profit_factor, 4),
-        "max_drawdown": round(result.max_drawdown, 2),
-        "max_drawdown_pct": round(result.max_drawdown_pct, 2),
-        "sharpe_ratio": round(result.sharpe_ratio, 4),
-        "expectancy": round(result.expectancy, 2),
+        "win_rate": result.win_rate,
+        "net_profit": result.net_profit,
+        "profit_factor": result.profit_factor,
+        "max_drawdown": result.max_drawdown,
+        "max_drawdown_pct": result.max_drawdown_pct,
+        "sharpe_ratio": result.sharpe_ratio,
+        "expectancy": result.expectancy,
     }
+
+
+def _round_stats(stats: dict) -> dict:
+    return {k: round(v, ROUND_SPECS[k]) if k in ROUND_SPECS else v for k, v in stats.items()}
+
+
+def _round_output(result: WFResult) -> None:
+    """Round per-window stats and fold metrics for output, once per run."""
+    for w in result.windows:
+        if w.train_stats is not None:
+            w.train_stats = _round_stats(w.train_stats)
+        if w.test_stats is not None:
+            w.test_stats = _round_stats(w.test_stats)
+            w.fold_metrics = FoldMetrics(*(w.test_stats[k] for k in FoldMetrics._fields))
+    result.fold_win_rates = [round(v, ROUND_SPECS["win_rate"]) for v in result.fold_win_rates]
+    result.fold_profit_factors = [
+        round(v, ROUND_SPECS["profit_factor"]) for v in result.fold_profit_factors
+    ]
+    result.fold_net_profits = [round(v, ROUND_SPECS["net_profit"]) for v in result.fold_net_profits]
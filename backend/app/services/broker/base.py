@@ -55,7 +55,7 @@ class AccountInfo:
     open_orders: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     position_id: str
     symbol: str
@@ -70,7 +70,7 @@ class Position:
     take_profit: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     order_id: str
     symbol: str
@@ -123,7 +123,7 @@ class SymbolInfo:
     asset_class: str = "forex"          # forex, crypto, index, commodity
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     timestamp: datetime
     open: float
@@ -133,7 +133,7 @@ class Candle:
     volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceTick:
     symbol: str
     bid: float
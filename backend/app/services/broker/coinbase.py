@@ -9,15 +9,23 @@ CDP keys format:
   api_secret: EC private key in PEM format
 """
 
+import asyncio
+import base64
+import importlib.util
 import json
 import logging
 import secrets
 import time
-import uuid
 from datetime import datetime, timezone
-from typing import Optional, AsyncGenerator
+from typing import Callable, Optional, AsyncGenerator
 
 import httpx
+import numpy as np
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+from app.core.config import settings
 
 from .base import (
     BrokerAdapter,
@@ -37,6 +45,21 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# orjson is optional: compact bytes in/out, several times faster than the
+# stdlib on large candle / order payloads.  Falls back to json.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 # ── Timeframe mapping ─────────────────────────────────
 _TF_MAP = {
     "M1": "ONE_MINUTE", "M5": "FIVE_MINUTE", "M15": "FIFTEEN_MINUTE",
@@ -54,9 +77,69 @@ _GRANULARITY_SECONDS = {
     "SIX_HOUR": 21600, "ONE_DAY": 86400,
 }
 
+# timeframe → (granularity, bar seconds), resolved once at import
+_TF_GRANULARITY = {
+    tf: (gran, _GRANULARITY_SECONDS[gran]) for tf, gran in _TF_MAP.items()
+}
+
 # Max candles Coinbase returns per request
 _MAX_CANDLES_PER_REQUEST = 350
 
+# CDP JWTs are valid for 120s.  With settings.COINBASE_JWT_REUSE on, a token
+# is reused for the same method + path until it has less than
+# _JWT_MIN_REMAINING seconds left; otherwise every request is signed afresh.
+_JWT_LIFETIME = 120
+_JWT_MIN_REMAINING = 30
+
+# Product catalog (get_symbols) is refetched at most this often
+_SYMBOLS_TTL = 300.0
+
+# One pooled client per adapter: keepalive reuse across signed calls, and
+# HTTP/2 multiplexing for the gather fan-outs when the h2 extra is present.
+_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Accounts payload from connect / a previous call is reused this long
+_ACCOUNTS_TTL = 5.0
+
+# is_connected() trusts any successful call made within this window
+_HEALTH_TTL = 30.0
+
+# Advanced Trade market-data WebSocket; subscriptions are re-signed before
+# the JWT lifetime runs out
+_WS_URL = "wss://advanced-trade-ws.coinbase.com"
+_WS_RESUBSCRIBE = 100.0
+
+# A dropped socket is reconnected this many times in a row (backoff doubling
+# from _WS_RECONNECT_BACKOFF seconds) before stream_prices falls back to polling
+_WS_MAX_RECONNECTS = 3
+_WS_RECONNECT_BACKOFF = 1.0
+
+
+def _limit_gtc(r: OrderRequest) -> dict:
+    return {"limit_limit_gtc": {"base_size": str(r.size), "limit_price": str(r.price)}}
+
+
+def _stop_limit_gtc(r: OrderRequest) -> dict:
+    return {"stop_limit_stop_limit_gtc": {
+        "base_size": str(r.size),
+        "limit_price": str(r.price),
+        "stop_price": str(r.price),
+    }}
+
+
+# (order type, side) → order_configuration builder.  Market buys are sized
+# in quote currency, everything else in base currency.
+_ORDER_BUILDERS: dict[tuple[OrderType, OrderSide], Callable[[OrderRequest], dict]] = {
+    (OrderType.MARKET, OrderSide.BUY): lambda r: {"market_market_ioc": {"quote_size": str(r.size)}},
+    (OrderType.MARKET, OrderSide.SELL): lambda r: {"market_market_ioc": {"base_size": str(r.size)}},
+    (OrderType.LIMIT, OrderSide.BUY): _limit_gtc,
+    (OrderType.LIMIT, OrderSide.SELL): _limit_gtc,
+    (OrderType.STOP, OrderSide.BUY): _stop_limit_gtc,
+    (OrderType.STOP, OrderSide.SELL): _stop_limit_gtc,
+}
+
 # Known base currencies for 6-char symbol splitting (e.g. BTCUSD → BTC-USD)
 _KNOWN_BASE = {
     "BTC", "ETH", "SOL", "XRP", "ADA", "DOGE", "DOT", "AVAX", "LINK",
@@ -101,9 +184,8 @@ def _to_coinbase_product(symbol: str) -> str:
     return s  # Return as-is if we can't normalise
 
 
-def _build_jwt(api_key: str, api_secret: str, uri: str = "") -> str:
-    """Build a JWT token for Coinbase CDP API authentication."""
-    import jwt as pyjwt
+def _load_private_key(api_secret: str):
+    """Parse the CDP API secret (EC private key PEM) into a key object."""
     from cryptography.hazmat.primitives import serialization
 
     # Normalize PEM key: Coinbase JSON files use literal \n escape sequences
@@ -112,26 +194,40 @@ def _build_jwt(api_key: str, api_secret: str, uri: str = "") -> str:
     if not secret.endswith("\n"):
         secret += "\n"
 
-    private_key_bytes = secret.encode("utf-8")
-    private_key = serialization.load_pem_private_key(private_key_bytes, password=None)
+    return serialization.load_pem_private_key(secret.encode("utf-8"), password=None)
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _build_jwt(api_key: str, private_key, uri: str = "") -> str:
+    """Build a JWT token for Coinbase CDP API authentication.
 
+    ``private_key`` is the object returned by ``_load_private_key``.  The
+    ES256 token is assembled directly: header.claims signed with ECDSA
+    P-256 / SHA-256, signature encoded as raw r||s per RFC 7518.
+    """
     now = int(time.time())
+    header = {"alg": "ES256", "typ": "JWT", "kid": api_key, "nonce": secrets.token_hex()}
     claims = {
         "sub": api_key,
         "iss": "cdp",
         "nbf": now,
-        "exp": now + 120,
+        "exp": now + _JWT_LIFETIME,
     }
     if uri:
         claims["uri"] = uri
 
-    token = pyjwt.encode(
-        claims,
-        private_key,
-        algorithm="ES256",
-        headers={"kid": api_key, "nonce": secrets.token_hex()},
+    signing_input = (
+        _b64url(_json_dumps(header))
+        + b"."
+        + _b64url(_json_dumps(claims))
     )
-    return token
+    der_sig = private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+    r, s = decode_dss_signature(der_sig)
+    signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
 
 class CoinbaseAdapter(BrokerAdapter):
@@ -146,22 +242,47 @@ class CoinbaseAdapter(BrokerAdapter):
     broker_name = "coinbase"
 
     _BASE_URL = "https://api.coinbase.com"
+    _HOST = _BASE_URL.split("://", 1)[1]
 
     def __init__(self, api_key: str, api_secret: str):
         self._api_key = api_key
         self._api_secret = api_secret
+        # Parsed once on first connect; the PEM string is dropped after that
+        self._private_key = None
         self._client: Optional[httpx.AsyncClient] = None
         self._connected = False
         self._last_error: str = ""
+        # (METHOD, path) → (token, expiry epoch seconds); only used when
+        # settings.COINBASE_JWT_REUSE is on
+        self._jwt_reuse = settings.COINBASE_JWT_REUSE
+        self._jwt_cache: dict[tuple[str, str], tuple[str, float]] = {}
+        # (monotonic fetch time, online products)
+        self._symbols_cache: Optional[tuple[float, list[SymbolInfo]]] = None
+        # (monotonic fetch time, /accounts payload)
+        self._accounts_cache: Optional[tuple[float, dict]] = None
+        # Monotonic time of the last successful REST call (health cache)
+        self._last_ok_ts: float = 0.0
 
     # ── Auth helpers ───────────────────────────────────
 
     def _auth_headers(self, method: str, path: str) -> dict:
-        """Build JWT auth headers for a Coinbase API request."""
-        # Coinbase CDP JWT spec requires URI without protocol: "GET api.coinbase.com/path"
-        host = self._BASE_URL.replace("https://", "").replace("http://", "")
-        uri = f"{method.upper()} {host}{path}"
-        token = _build_jwt(self._api_key, self._api_secret, uri)
+        """Build JWT auth headers for a Coinbase API request.
+
+        A fresh JWT is signed per request.  With COINBASE_JWT_REUSE on, the
+        token (bound to method + path, not query string) is instead reused
+        for repeat calls to the same endpoint until it nears expiry.
+        """
+        method = method.upper()
+        now = time.time()
+        cached = self._jwt_cache.get((method, path)) if self._jwt_reuse else None
+        if cached and cached[1] - now > _JWT_MIN_REMAINING:
+            token = cached[0]
+        else:
+            # Coinbase CDP JWT spec requires URI without protocol: "GET api.coinbase.com/path"
+            uri = f"{method} {self._HOST}{path}"
+            token = _build_jwt(self._api_key, self._private_key, uri)
+            if self._jwt_reuse:
+                self._jwt_cache[(method, path)] = (token, int(now) + _JWT_LIFETIME)
         return {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
@@ -176,37 +297,49 @@ class CoinbaseAdapter(BrokerAdapter):
             headers=headers,
         )
         r.raise_for_status()
-        return r.json()
+        self._last_ok_ts = time.monotonic()
+        return _json_loads(r.content)
 
     async def _post(self, path: str, body: dict) -> dict:
         assert self._client, "Not connected"
-        body_str = json.dumps(body)
         headers = self._auth_headers("POST", path)
         r = await self._client.post(
             f"{self._BASE_URL}{path}",
-            content=body_str,
+            content=_json_dumps(body),
             headers=headers,
         )
         r.raise_for_status()
-        return r.json()
+        self._last_ok_ts = time.monotonic()
+        # Every POST is an order mutation; balances may have moved
+        self._accounts_cache = None
+        return _json_loads(r.content)
 
     @staticmethod
     def _parse_ts(ts_str: str) -> datetime:
         if ts_str:
             try:
-                return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                if ts_str.endswith("Z"):
+                    ts_str = ts_str[:-1] + "+00:00"
+                return datetime.fromisoformat(ts_str)
             except ValueError:
                 pass
-        return datetime.now(timezone.utc)
+        return datetime.now(_UTC)
 
     # ── Connection ─────────────────────────────────────
 
     async def connect(self) -> bool:
         self._last_error = ""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS, http2=_HTTP2,
+        )
         logger.info("Coinbase connecting with API key %s...", self._api_key[:8] if len(self._api_key) > 8 else "***")
         try:
-            data = await self._get("/api/v3/brokerage/accounts")
+            if self._private_key is None:
+                self._private_key = _load_private_key(self._api_secret)
+                self._api_secret = ""
+            data = await self._get_accounts(max_age=0)
             self._connected = True
             logger.info("Coinbase connected: %d accounts", len(data.get("accounts", [])))
             return True
@@ -227,12 +360,18 @@ class CoinbaseAdapter(BrokerAdapter):
             await self._client.aclose()
             self._client = None
         self._connected = False
+        self._jwt_cache.clear()
+        self._symbols_cache = None
+        self._accounts_cache = None
+        self._last_ok_ts = 0.0
 
     async def is_connected(self) -> bool:
         if not self._connected or not self._client:
             return False
+        if time.monotonic() - self._last_ok_ts < _HEALTH_TTL:
+            return True
         try:
-            await self._get("/api/v3/brokerage/accounts")
+            await self._get_accounts(max_age=0)
             return True
         except Exception:
             self._connected = False
@@ -240,15 +379,28 @@ class CoinbaseAdapter(BrokerAdapter):
 
     # ── Account ────────────────────────────────────────
 
-    async def get_account_info(self) -> AccountInfo:
+    async def _get_accounts(self, max_age: float = _ACCOUNTS_TTL) -> dict:
+        """GET /accounts, reusing a payload fetched within ``max_age`` seconds."""
+        cached = self._accounts_cache
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
         data = await self._get("/api/v3/brokerage/accounts")
+        self._accounts_cache = (time.monotonic(), data)
+        return data
+
+    async def get_account_info(self) -> AccountInfo:
+        data = await self._get_accounts()
         accounts = data.get("accounts", [])
 
-        # Sum up balances across all crypto accounts
+        # Sum up balances across all crypto accounts and count the
+        # non-dust ones in the same pass
         total_balance = 0.0
+        open_positions = 0
         for acct in accounts:
-            bal = acct.get("available_balance", {})
-            total_balance += float(bal.get("value", 0))
+            value = float(acct.get("available_balance", {}).get("value", 0))
+            total_balance += value
+            if value > 0.01:
+                open_positions += 1
 
         return AccountInfo(
             account_id="coinbase_all",
@@ -259,15 +411,15 @@ class CoinbaseAdapter(BrokerAdapter):
             unrealized_pnl=0,
             margin_used=0,
             margin_available=total_balance,
-            open_positions=len([a for a in accounts if float(a.get("available_balance", {}).get("value", 0)) > 0.01]),
+            open_positions=open_positions,
             open_orders=0,
         )
 
     # ── Positions ──────────────────────────────────────
 
     async def get_positions(self) -> list[Position]:
-        data = await self._get("/api/v3/brokerage/accounts")
-        positions: list[Position] = []
+        data = await self._get_accounts()
+        holdings = []
 
         for acct in data.get("accounts", []):
             bal = acct.get("available_balance", {})
@@ -276,28 +428,56 @@ class CoinbaseAdapter(BrokerAdapter):
 
             if amount < 0.01 or currency == "USD":
                 continue
+            holdings.append((acct.get("uuid", currency), f"{currency}-USD", amount))
 
-            # Try to get current price
-            product_id = f"{currency}-USD"
-            try:
-                ticker = await self._get(f"/api/v3/brokerage/products/{product_id}")
-                price = float(ticker.get("price", 0))
-            except Exception:
-                price = 0
+        # One batched price lookup for every held product
+        prices = await self._get_product_prices([pid for _, pid, _ in holdings])
+        now = datetime.now(_UTC)
 
-            positions.append(Position(
-                position_id=acct.get("uuid", currency),
+        return [
+            Position(
+                position_id=position_id,
                 symbol=product_id,
                 side=PositionSide.LONG,
                 size=amount,
                 entry_price=0,
-                current_price=price,
+                current_price=prices.get(product_id, 0),
                 unrealized_pnl=0,
                 margin_used=0,
-                open_time=datetime.now(timezone.utc),
-            ))
+                open_time=now,
+            )
+            for position_id, product_id, amount in holdings
+        ]
+
+    async def _get_product_prices(self, product_ids: list[str]) -> dict[str, float]:
+        """Last-trade price per product_id, fetched in a single request.
+
+        Falls back to concurrent per-product lookups if the batched list
+        call fails.  Products that can't be priced are left out.
+        """
+        if not product_ids:
+            return {}
+        try:
+            data = await self._get(
+                "/api/v3/brokerage/products",
+                params={"product_ids": product_ids},
+            )
+            return {
+                p.get("product_id", ""): float(p.get("price") or 0)
+                for p in data.get("products", [])
+            }
+        except Exception as e:
+            logger.debug("Coinbase batched product lookup failed, falling back: %s", e)
 
-        return positions
+        results = await asyncio.gather(
+            *(self._get(f"/api/v3/brokerage/products/{pid}") for pid in product_ids),
+            return_exceptions=True,
+        )
+        return {
+            pid: float(r.get("price", 0))
+            for pid, r in zip(product_ids, results)
+            if not isinstance(r, BaseException)
+        }
 
     async def close_position(self, position_id: str, size: Optional[float] = None) -> Order:
         # For crypto, "closing" means selling the holding
@@ -320,29 +500,10 @@ class CoinbaseAdapter(BrokerAdapter):
 
     async def place_order(self, request: OrderRequest) -> Order:
         product_id = _to_coinbase_product(request.symbol)
-        client_order_id = str(uuid.uuid4())
+        client_order_id = secrets.token_hex(16)
 
-        order_config: dict = {}
-        if request.order_type == OrderType.MARKET:
-            if request.side == OrderSide.BUY:
-                order_config["market_market_ioc"] = {
-                    "quote_size": str(request.size),
-                }
-            else:
-                order_config["market_market_ioc"] = {
-                    "base_size": str(request.size),
-                }
-        elif request.order_type == OrderType.LIMIT:
-            order_config["limit_limit_gtc"] = {
-                "base_size": str(request.size),
-                "limit_price": str(request.price),
-            }
-        elif request.order_type == OrderType.STOP:
-            order_config["stop_limit_stop_limit_gtc"] = {
-                "base_size": str(request.size),
-                "limit_price": str(request.price),
-                "stop_price": str(request.price),
-            }
+        build = _ORDER_BUILDERS.get((request.order_type, request.side))
+        order_config = build(request) if build else {}
 
         body = {
             "client_order_id": client_order_id,
@@ -366,7 +527,7 @@ class CoinbaseAdapter(BrokerAdapter):
             stop_loss=request.stop_loss,
             take_profit=request.take_profit,
             status=OrderStatus.FILLED if data.get("success") else OrderStatus.PENDING,
-            created_time=datetime.now(timezone.utc),
+            created_time=datetime.now(_UTC),
         )
 
     async def modify_order(self, request: OrderModifyRequest) -> Order:
@@ -433,6 +594,9 @@ class CoinbaseAdapter(BrokerAdapter):
     # ── Market Data ────────────────────────────────────
 
     async def get_symbols(self) -> list[SymbolInfo]:
+        if self._symbols_cache and time.monotonic() - self._symbols_cache[0] < _SYMBOLS_TTL:
+            return list(self._symbols_cache[1])
+
         data = await self._get("/api/v3/brokerage/products")
         symbols: list[SymbolInfo] = []
 
@@ -454,7 +618,8 @@ class CoinbaseAdapter(BrokerAdapter):
                 asset_class="crypto",
             ))
 
-        return symbols
+        self._symbols_cache = (time.monotonic(), symbols)
+        return list(symbols)
 
     async def get_candles(
         self,
@@ -465,19 +630,19 @@ class CoinbaseAdapter(BrokerAdapter):
         to_time: Optional[datetime] = None,
     ) -> list[Candle]:
         product_id = _to_coinbase_product(symbol)
-        granularity = _TF_MAP.get(timeframe, "ONE_HOUR")
-        bar_seconds = _GRANULARITY_SECONDS.get(granularity, 3600)
+        granularity, bar_seconds = _TF_GRANULARITY.get(timeframe, ("ONE_HOUR", 3600))
 
         now = int(time.time())
         end_ts = int(to_time.timestamp()) if to_time else now
         start_ts = int(from_time.timestamp()) if from_time else end_ts - (count * bar_seconds)
 
-        # Paginate: Coinbase caps each request at 350 candles
-        all_candles: list[Candle] = []
+        # Paginate: Coinbase caps each request at 350 candles.  Raw rows are
+        # collected as-is and converted to floats in one numpy call below.
+        rows: list[tuple] = []
         cursor_end = end_ts
 
-        while cursor_end > start_ts and len(all_candles) < count:
-            chunk_bars = min(_MAX_CANDLES_PER_REQUEST, count - len(all_candles))
+        while cursor_end > start_ts and len(rows) < count:
+            chunk_bars = min(_MAX_CANDLES_PER_REQUEST, count - len(rows))
             cursor_start = cursor_end - (chunk_bars * bar_seconds)
             if cursor_start < start_ts:
                 cursor_start = start_ts
@@ -504,31 +669,34 @@ class CoinbaseAdapter(BrokerAdapter):
             if not batch:
                 break
 
-            for c in batch:
-                all_candles.append(Candle(
-                    timestamp=datetime.fromtimestamp(int(c.get("start", 0)), tz=timezone.utc),
-                    open=float(c.get("open", 0)),
-                    high=float(c.get("high", 0)),
-                    low=float(c.get("low", 0)),
-                    close=float(c.get("close", 0)),
-                    volume=float(c.get("volume", 0)),
-                ))
+            rows.extend(
+                (
+                    c.get("start", 0), c.get("open", 0), c.get("high", 0),
+                    c.get("low", 0), c.get("close", 0), c.get("volume", 0),
+                )
+                for c in batch
+            )
 
             # Move window back for next chunk
             cursor_end = cursor_start
 
-        # Coinbase returns newest first per batch — sort all by timestamp ascending
-        all_candles.sort(key=lambda c: c.timestamp)
-        # Deduplicate (overlapping windows can cause dupes)
-        seen: set = set()
-        unique: list[Candle] = []
-        for c in all_candles:
-            key = c.timestamp.timestamp()
-            if key not in seen:
-                seen.add(key)
-                unique.append(c)
+        if not rows:
+            return []
 
-        return unique[-count:] if len(unique) > count else unique
+        # Coinbase returns newest first per batch — sort all by timestamp
+        # ascending, then deduplicate (overlapping windows can cause dupes).
+        arr = np.array(rows, dtype=np.float64)
+        arr = arr[np.argsort(arr[:, 0], kind="stable")]
+        _, first = np.unique(arr[:, 0], return_index=True)
+        arr = arr[first[-count:]]
+
+        return [
+            Candle(
+                timestamp=datetime.fromtimestamp(int(ts), tz=_UTC),
+                open=o, high=h, low=l, close=c, volume=v,
+            )
+            for ts, o, h, l, c, v in arr.tolist()
+        ]
 
     async def get_initial_bars(self, symbol: str, timeframe: str, count: int = 500) -> list[dict]:
         """Return the last `count` bars as plain dicts (for agent warmup).
@@ -565,7 +733,7 @@ class CoinbaseAdapter(BrokerAdapter):
             symbol=product_id,
             bid=bid,
             ask=ask,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.now(_UTC),
             spread=ask - bid,
         )
 
@@ -573,18 +741,127 @@ class CoinbaseAdapter(BrokerAdapter):
 
     async def stream_prices(self, symbols: list[str]) -> AsyncGenerator[PriceTick, None]:
         """
-        Coinbase WebSocket streaming is complex (requires JWT auth for advanced).
-        For now, we poll every 2 seconds as a fallback.
-        """
-        import asyncio
+        Server-pushed ticker updates over the Advanced Trade WebSocket.
 
+        A dropped socket is reconnected with backoff; after
+        ``_WS_MAX_RECONNECTS`` failures in a row without a tick (or if the
+        websockets package is missing) this falls back to REST polling every
+        2 seconds.
+        """
         product_ids = [_to_coinbase_product(s) for s in symbols]
 
+        failures = 0
         while True:
-            for pid in product_ids:
-                try:
-                    tick = await self.get_price(pid)
+            try:
+                async for tick in self._stream_ws(product_ids):
+                    failures = 0
                     yield tick
-                except Exception:
-                    pass
+            except ImportError:
+                logger.warning("websockets package not installed — polling Coinbase prices")
+                break
+            except Exception as e:
+                failures += 1
+                if failures > _WS_MAX_RECONNECTS:
+                    logger.warning("Coinbase WebSocket stream failed (%s) — falling back to polling", e)
+                    break
+                delay = _WS_RECONNECT_BACKOFF * 2 ** (failures - 1)
+                logger.warning("Coinbase WebSocket dropped (%s) — reconnecting in %.0fs", e, delay)
+                await asyncio.sleep(delay)
+
+        async for tick in self._poll_prices(product_ids):
+            yield tick
+
+    async def _stream_ws(self, product_ids: list[str]) -> AsyncGenerator[PriceTick, None]:
+        """Subscribe to the ticker channel and yield each ticker update.
+
+        The heartbeats channel is subscribed alongside it, since Coinbase
+        closes subscriptions that see no traffic for a minute or so.
+        Coinbase JWTs expire after two minutes, so the subscriptions are
+        re-sent with a fresh token every ``_WS_RESUBSCRIBE`` seconds.
+        """
+        import websockets
+
+        async def subscribe(ws) -> None:
+            for channel in ("heartbeats", "ticker"):
+                msg = {"type": "subscribe", "product_ids": product_ids, "channel": channel}
+                if self._private_key is not None:
+                    msg["jwt"] = _build_jwt(self._api_key, self._private_key)
+                await ws.send(_json_dumps(msg).decode())
+
+        async with websockets.connect(_WS_URL, max_size=None) as ws:
+            await subscribe(ws)
+            resubscribe_at = time.monotonic() + _WS_RESUBSCRIBE
+
+            while True:
+                try:
+                    raw = await asyncio.wait_for(
+                        ws.recv(), timeout=max(resubscribe_at - time.monotonic(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    await subscribe(ws)
+                    resubscribe_at = time.monotonic() + _WS_RESUBSCRIBE
+                    continue
+
+                msg = _json_loads(raw)
+                if msg.get("type") == "error":
+                    raise RuntimeError(msg.get("message", "subscription error"))
+                if msg.get("channel") != "ticker":
+                    continue
+
+                now = datetime.now(_UTC)
+                for event in msg.get("events", []):
+                    for t in event.get("tickers", []):
+                        price = float(t.get("price") or 0)
+                        bid = float(t.get("best_bid") or 0) or price
+                        ask = float(t.get("best_ask") or 0) or price
+                        if not bid and not ask:
+                            continue
+                        yield PriceTick(
+                            symbol=t.get("product_id", ""),
+                            bid=bid,
+                            ask=ask,
+                            timestamp=now,
+                            spread=ask - bid,
+                        )
+
+    async def _poll_prices(self, product_ids: list[str]) -> AsyncGenerator[PriceTick, None]:
+        """REST polling fallback: one best_bid_ask request per 2s cycle, or
+        concurrent per-product lookups if that call fails."""
+        while True:
+            try:
+                ticks = await self._get_best_bid_ask(product_ids)
+            except Exception:
+                results = await asyncio.gather(
+                    *(self.get_price(pid) for pid in product_ids),
+                    return_exceptions=True,
+                )
+                ticks = [r for r in results if not isinstance(r, BaseException)]
+            for tick in ticks:
+                yield tick
             await asyncio.sleep(2)
+
+    async def _get_best_bid_ask(self, product_ids: list[str]) -> list[PriceTick]:
+        """Top-of-book quotes for several products in one request."""
+        data = await self._get(
+            "/api/v3/brokerage/best_bid_ask",
+            params={"product_ids": product_ids},
+        )
+        now = datetime.now(_UTC)
+        ticks: list[PriceTick] = []
+        for book in data.get("pricebooks", []):
+            bids = book.get("bids") or [{}]
+            asks = book.get("asks") or [{}]
+            bid = float(bids[0].get("price", 0))
+            ask = float(asks[0].get("price", 0))
+            if not bid and not ask:
+                continue
+            bid = bid or ask
+            ask = ask or bid
+            ticks.append(PriceTick(
+                symbol=book.get("product_id", ""),
+                bid=bid,
+                ask=ask,
+                timestamp=now,
+                spread=ask - bid,
+            ))
+        return ticks
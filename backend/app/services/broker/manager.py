@@ -22,6 +22,9 @@ class BrokerManager:
     def __init__(self):
         self._adapters: dict[str, BrokerAdapter] = {}
         self._default_broker: Optional[str] = None
+        # Serialises registry / default-broker updates across concurrent
+        # disconnects so the fallback choice stays deterministic
+        self._lock = asyncio.Lock()
 
     @property
     def active_brokers(self) -> list[str]:
@@ -59,31 +62,46 @@ class BrokerManager:
 
     async def disconnect_broker(self, broker_name: str) -> None:
         """Disconnect and remove a broker adapter."""
-        adapter = self._adapters.pop(broker_name, None)
+        async with self._lock:
+            adapter = self._adapters.pop(broker_name, None)
+            if adapter and self._default_broker == broker_name:
+                self._default_broker = self.active_brokers[0] if self.active_brokers else None
         if adapter:
             await adapter.disconnect()
-            if self._default_broker == broker_name:
-                self._default_broker = self.active_brokers[0] if self.active_brokers else None
             logger.info("Broker %s disconnected", broker_name)
 
     async def disconnect_all(self) -> None:
-        """Disconnect all brokers."""
-        for name in list(self._adapters.keys()):
-            await self.disconnect_broker(name)
+        """Disconnect all brokers concurrently."""
+        names = list(self._adapters.keys())
+        results = await asyncio.gather(
+            *(self.disconnect_broker(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning("Broker %s disconnect failed: %s", name, result)
 
     async def get_status(self) -> dict:
         """Get connection status for all brokers."""
+        # Probe concurrently so total latency is the slowest broker, not the sum
+        adapters = list(self._adapters.items())
+        results = await asyncio.gather(
+            *(adapter.is_connected() for _, adapter in adapters),
+            return_exceptions=True,
+        )
         status = {}
-        for name, adapter in self._adapters.items():
-            try:
-                connected = await adapter.is_connected()
-            except Exception:
+        for (name, adapter), connected in zip(adapters, results):
+            if isinstance(connected, BaseException):
                 connected = False
             status[name] = {
                 "connected": connected,
                 "broker_name": adapter.broker_name,
                 "is_default": name == self._default_broker,
             }
+            # Adapters that time their calls (MT5) report per-operation percentiles
+            latency = getattr(adapter, "get_latency_percentiles", None)
+            if latency is not None:
+                status[name]["latency"] = latency()
         return status
 
 
@@ -2,8 +2,8 @@
 MetaTrader 5 Bridge Adapter.
 
 Wraps the MetaTrader5 Python package for live trading.
-MT5 operations are synchronous, so we run them in a thread pool
-to avoid blocking the async event loop.
+MT5 operations are synchronous, so we run them on a dedicated worker
+thread to avoid blocking the async event loop.
 
 Requirements:
   pip install MetaTrader5
@@ -12,10 +12,15 @@ Requirements:
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timezone, timedelta
 from typing import Optional, AsyncGenerator
 
+import numpy as np
+
 from .base import (
     BrokerAdapter,
     AccountInfo,
@@ -34,11 +39,67 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for running synchronous MT5 calls
-_mt5_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mt5")
+
+def _resolve(fut: asyncio.Future, result, exc) -> None:
+    """Complete ``fut`` on its own loop unless the awaiting task gave up."""
+    if fut.cancelled():
+        return
+    if exc is not None:
+        fut.set_exception(exc)
+    else:
+        fut.set_result(result)
+
+
+class _MT5Worker:
+    """Single daemon thread that runs blocking MT5 calls in FIFO order.
+
+    The terminal IPC is single-threaded, so extra pool threads only add lock
+    contention; one thread also guarantees submission order (e.g. a cancel
+    queued after a place is executed after it).
+    """
+
+    def __init__(self, name: str = "mt5"):
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, args: tuple, fut: asyncio.Future) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._loop, name=self._name, daemon=True,
+                    )
+                    self._thread.start()
+        self._queue.put((func, args, fut))
+
+    def _loop(self) -> None:
+        while True:
+            func, args, fut = self._queue.get()
+            result, exc = None, None
+            try:
+                result = func(*args)
+            except BaseException as e:
+                exc = e
+            try:
+                fut.get_loop().call_soon_threadsafe(_resolve, fut, result, exc)
+            except RuntimeError:
+                pass  # event loop already closed
+
+
+_mt5_worker = _MT5Worker()
+
+# Per-operation wall-clock latency of _run (queue wait + call), nanoseconds.
+# Bounded reservoirs of the most recent samples.
+_latencies: defaultdict[str, deque] = defaultdict(lambda: deque(maxlen=1024))
 
 # ── Timeframe mapping ─────────────────────────────────
 _TF_MAP: dict[str, int] = {}  # populated on import if mt5 available
+_TF_DEFAULT = 0
+
+# symbol_info() results are reused this long (contract specs rarely change)
+_SYMBOL_INFO_TTL = 60.0
 
 try:
     import MetaTrader5 as mt5
@@ -55,30 +116,79 @@ try:
         "1h": mt5.TIMEFRAME_H1, "4h": mt5.TIMEFRAME_H4,
         "1d": mt5.TIMEFRAME_D1,
     }
+    _TF_DEFAULT = mt5.TIMEFRAME_H1
+
+    # Order-path functions and constants bound once, so submissions skip
+    # the module attribute lookups on every call
+    _ORDER_SEND = mt5.order_send
+    _POSITIONS_GET = mt5.positions_get
+    _SYMBOL_INFO_TICK = mt5.symbol_info_tick
+    _ORDER_BUY, _ORDER_SELL = mt5.ORDER_TYPE_BUY, mt5.ORDER_TYPE_SELL
+    _ORDER_BUY_LIMIT, _ORDER_SELL_LIMIT = mt5.ORDER_TYPE_BUY_LIMIT, mt5.ORDER_TYPE_SELL_LIMIT
+    _ORDER_BUY_STOP, _ORDER_SELL_STOP = mt5.ORDER_TYPE_BUY_STOP, mt5.ORDER_TYPE_SELL_STOP
+    _ACTION_DEAL, _ACTION_PENDING = mt5.TRADE_ACTION_DEAL, mt5.TRADE_ACTION_PENDING
+    _FILLING_IOC, _FILLING_FOK, _FILLING_RETURN = (
+        mt5.ORDER_FILLING_IOC, mt5.ORDER_FILLING_FOK, mt5.ORDER_FILLING_RETURN,
+    )
+    _TIME_GTC = mt5.ORDER_TIME_GTC
+    _RETCODE_DONE = mt5.TRADE_RETCODE_DONE
     _MT5_AVAILABLE = True
 except ImportError:
     mt5 = None  # type: ignore
+    _ORDER_SEND = _POSITIONS_GET = _SYMBOL_INFO_TICK = None
+    _ORDER_BUY = _ORDER_SELL = _ORDER_BUY_LIMIT = _ORDER_SELL_LIMIT = 0
+    _ORDER_BUY_STOP = _ORDER_SELL_STOP = _ACTION_DEAL = _ACTION_PENDING = 0
+    _FILLING_IOC = _FILLING_FOK = _FILLING_RETURN = _TIME_GTC = _RETCODE_DONE = 0
     _MT5_AVAILABLE = False
     logger.warning("MetaTrader5 package not installed — MT5 adapter unavailable")
 
 
+# symbol → filling mode the broker last accepted
+_FILLING_CACHE: dict[str, int] = {}
+
+
 def _order_send_with_filling_fallback(request: dict):
     """
     Try different MT5 order filling modes.
     Retcode 10030 = unsupported filling mode — try the next mode.
+    The mode that worked for a symbol is tried first on later orders.
+    ``request`` is owned by the caller's one-shot builder and is updated in
+    place with the filling mode being tried.
+
+    order_send blocks until the trade server replies; the Python package
+    has no async variant (OrderSendAsync is MQL5-only), so this always
+    runs on the MT5 worker thread.
     """
-    import MetaTrader5 as mt5
-    filling_modes = [mt5.ORDER_FILLING_IOC, mt5.ORDER_FILLING_FOK, mt5.ORDER_FILLING_RETURN]
+    symbol = request.get("symbol", "")
     last_result = None
+    if request.get("action") == _ACTION_PENDING:
+        # Pending orders nearly always accept RETURN, so send that first and
+        # only probe the other modes if the broker rejects it
+        request["type_filling"] = _FILLING_RETURN
+        result = _ORDER_SEND(request)
+        if result is not None and result.retcode != 10030:
+            return result
+        last_result = result
+        filling_modes = [_FILLING_IOC, _FILLING_FOK]
+        cache = False
+    else:
+        filling_modes = [_FILLING_IOC, _FILLING_FOK, _FILLING_RETURN]
+        known = _FILLING_CACHE.get(symbol)
+        if known is not None:
+            filling_modes.remove(known)
+            filling_modes.insert(0, known)
+        cache = True
     for filling in filling_modes:
-        req = {**request, "type_filling": filling}
-        result = mt5.order_send(req)
+        request["type_filling"] = filling
+        result = _ORDER_SEND(request)
         if result is None:
             last_result = result
             continue
         if result.retcode == 10030:  # Unsupported filling mode
             last_result = result
             continue
+        if cache:
+            _FILLING_CACHE[symbol] = filling
         return result
     return last_result
 
@@ -88,8 +198,13 @@ class MT5Adapter(BrokerAdapter):
     MetaTrader 5 bridge adapter.
 
     Uses the MetaTrader5 Python package which communicates with a local
-    MT5 terminal instance. All MT5 calls are synchronous and run in a
-    thread pool to keep the async event loop responsive.
+    MT5 terminal instance. All MT5 calls are synchronous and run on a
+    dedicated worker thread to keep the async event loop responsive.
+
+    The MetaTrader5 package holds a single terminal connection per process,
+    so all adapters share one worker and one logged-in account.  Multiple
+    concurrent accounts need one terminal process each, reached through
+    ``MT5RemoteAdapter`` (MT5_BRIDGE_URL).
 
     Args:
         server:   MT5 broker server name (e.g. "MetaQuotes-Demo")
@@ -104,13 +219,55 @@ class MT5Adapter(BrokerAdapter):
         self._login = login
         self._password = password
         self._connected = False
+        # symbol → (monotonic fetch time, mt5 SymbolInfo)
+        self._symbol_info_cache: dict[str, tuple[float, object]] = {}
 
-    # ── Thread-pool helper ────────────────────────────
+    # ── Worker-thread helper ──────────────────────────
 
     async def _run(self, func, *args):
-        """Run a synchronous MT5 function in the thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_mt5_pool, func, *args)
+        """Run a synchronous MT5 function on the MT5 worker thread."""
+        fut = asyncio.get_running_loop().create_future()
+        t0 = time.perf_counter_ns()
+        try:
+            _mt5_worker.submit(func, args, fut)
+            return await fut
+        finally:
+            name = (getattr(func, "__qualname__", None) or repr(func)).replace(".<locals>", "")
+            _latencies[name].append(time.perf_counter_ns() - t0)
+
+    @staticmethod
+    def get_latency_percentiles() -> dict[str, dict]:
+        """p50/p95/p99 latency (ms) of recent MT5 calls, keyed by operation."""
+        stats = {}
+        for name, samples in list(_latencies.items()):
+            data = np.fromiter(tuple(samples), dtype=np.float64)
+            if not data.size:
+                continue
+            p50, p95, p99 = np.percentile(data, (50, 95, 99)) / 1e6
+            stats[name] = {
+                "count": int(data.size),
+                "p50_ms": round(float(p50), 3),
+                "p95_ms": round(float(p95), 3),
+                "p99_ms": round(float(p99), 3),
+            }
+        return stats
+
+    def _symbol_info_sync(self, symbol: str):
+        """Cached mt5.symbol_info; makes the symbol visible on first fetch.
+
+        Runs on the worker thread.  Returns None if the symbol is unknown.
+        """
+        cached = self._symbol_info_cache.get(symbol)
+        now = time.monotonic()
+        if cached and now - cached[0] < _SYMBOL_INFO_TTL:
+            return cached[1]
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            return None
+        if not info.visible:
+            mt5.symbol_select(symbol, True)
+        self._symbol_info_cache[symbol] = (now, info)
+        return info
 
     # ── Connection ────────────────────────────────────
 
@@ -154,6 +311,7 @@ class MT5Adapter(BrokerAdapter):
         if _MT5_AVAILABLE and self._connected:
             await self._run(mt5.shutdown)
         self._connected = False
+        self._symbol_info_cache.clear()
 
     async def is_connected(self) -> bool:
         if not self._connected or not _MT5_AVAILABLE:
@@ -192,6 +350,8 @@ class MT5Adapter(BrokerAdapter):
         if raw is None:
             return []
 
+        # Local bindings: this loop runs once per open position
+        fts, utc = datetime.fromtimestamp, timezone.utc
         positions: list[Position] = []
         for p in raw:
             positions.append(Position(
@@ -203,7 +363,7 @@ class MT5Adapter(BrokerAdapter):
                 current_price=p.price_current,
                 unrealized_pnl=p.profit,
                 margin_used=0,
-                open_time=datetime.fromtimestamp(p.time, tz=timezone.utc),
+                open_time=fts(p.time, utc),
                 stop_loss=p.sl if p.sl > 0 else None,
                 take_profit=p.tp if p.tp > 0 else None,
             ))
@@ -214,16 +374,16 @@ class MT5Adapter(BrokerAdapter):
         ticket = int(position_id)
 
         def _do_close():
-            pos = mt5.positions_get(ticket=ticket)
+            pos = _POSITIONS_GET(ticket=ticket)
             if not pos:
                 raise ValueError(f"Position {ticket} not found")
             p = pos[0]
 
-            close_type = mt5.ORDER_TYPE_SELL if p.type == 0 else mt5.ORDER_TYPE_BUY
+            close_type = _ORDER_SELL if p.type == 0 else _ORDER_BUY
             close_volume = size or p.volume
 
             request = {
-                "action": mt5.TRADE_ACTION_DEAL,
+                "action": _ACTION_DEAL,
                 "symbol": p.symbol,
                 "volume": close_volume,
                 "type": close_type,
@@ -231,7 +391,7 @@ class MT5Adapter(BrokerAdapter):
                 "deviation": 20,
                 "magic": 100,
                 "comment": "flowrexalgo_close",
-                "type_time": mt5.ORDER_TIME_GTC,
+                "type_time": _TIME_GTC,
             }
 
             result = _order_send_with_filling_fallback(request)
@@ -239,13 +399,14 @@ class MT5Adapter(BrokerAdapter):
 
         result = await self._run(_do_close)
 
-        if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+        if result is None or result.retcode != _RETCODE_DONE:
             err = result.comment if result else "unknown"
             raise RuntimeError(f"MT5 close failed: {err}")
 
+        req = getattr(result, "request", None)
         return Order(
             order_id=str(result.order),
-            symbol=result.request.symbol if hasattr(result, 'request') else "",
+            symbol=req.symbol if req else "",
             side=OrderSide.SELL,
             order_type=OrderType.MARKET,
             size=result.volume,
@@ -260,27 +421,24 @@ class MT5Adapter(BrokerAdapter):
 
     async def place_order(self, request: OrderRequest) -> Order:
         def _do_order():
-            symbol_info = mt5.symbol_info(request.symbol)
-            if symbol_info is None:
+            if self._symbol_info_sync(request.symbol) is None:
                 raise ValueError(f"Symbol {request.symbol} not found")
-            if not symbol_info.visible:
-                mt5.symbol_select(request.symbol, True)
 
             # Get current price for market orders
-            tick = mt5.symbol_info_tick(request.symbol)
+            tick = _SYMBOL_INFO_TICK(request.symbol)
             if tick is None:
                 raise RuntimeError(f"Cannot get tick for {request.symbol}")
 
             if request.side == OrderSide.BUY:
-                order_type = mt5.ORDER_TYPE_BUY
+                order_type = _ORDER_BUY
                 price = tick.ask
             else:
-                order_type = mt5.ORDER_TYPE_SELL
+                order_type = _ORDER_SELL
                 price = tick.bid
 
             # Build request
             mt5_request: dict = {
-                "action": mt5.TRADE_ACTION_DEAL,
+                "action": _ACTION_DEAL,
                 "symbol": request.symbol,
                 "volume": request.size,
                 "type": order_type,
@@ -288,22 +446,22 @@ class MT5Adapter(BrokerAdapter):
                 "deviation": 20,
                 "magic": 100,
                 "comment": request.comment or "flowrexalgo",
-                "type_time": mt5.ORDER_TIME_GTC,
+                "type_time": _TIME_GTC,
             }
 
             if request.order_type == OrderType.LIMIT:
-                mt5_request["action"] = mt5.TRADE_ACTION_PENDING
+                mt5_request["action"] = _ACTION_PENDING
                 mt5_request["type"] = (
-                    mt5.ORDER_TYPE_BUY_LIMIT if request.side == OrderSide.BUY
-                    else mt5.ORDER_TYPE_SELL_LIMIT
+                    _ORDER_BUY_LIMIT if request.side == OrderSide.BUY
+                    else _ORDER_SELL_LIMIT
                 )
                 mt5_request["price"] = request.price
 
             elif request.order_type == OrderType.STOP:
-                mt5_request["action"] = mt5.TRADE_ACTION_PENDING
+                mt5_request["action"] = _ACTION_PENDING
                 mt5_request["type"] = (
-                    mt5.ORDER_TYPE_BUY_STOP if request.side == OrderSide.BUY
-                    else mt5.ORDER_TYPE_SELL_STOP
+                    _ORDER_BUY_STOP if request.side == OrderSide.BUY
+                    else _ORDER_SELL_STOP
                 )
                 mt5_request["price"] = request.price
 
@@ -317,7 +475,7 @@ class MT5Adapter(BrokerAdapter):
 
         result = await self._run(_do_order)
 
-        if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+        if result is None or result.retcode != _RETCODE_DONE:
             err = result.comment if result else "unknown"
             code = result.retcode if result else -1
             raise RuntimeError(f"MT5 order failed ({code}): {err}")
@@ -339,31 +497,36 @@ class MT5Adapter(BrokerAdapter):
 
     async def modify_order(self, request: OrderModifyRequest) -> Order:
         def _do_modify():
+            try:
+                ticket = int(request.order_id)
+            except ValueError:
+                raise ValueError(f"Order/position {request.order_id} not found")
+
             # Try modifying position SL/TP first
-            positions = mt5.positions_get()
-            for p in (positions or []):
-                if str(p.ticket) == request.order_id:
-                    mod_request = {
-                        "action": mt5.TRADE_ACTION_SLTP,
-                        "symbol": p.symbol,
-                        "position": p.ticket,
-                        "sl": request.stop_loss or p.sl,
-                        "tp": request.take_profit or p.tp,
-                    }
-                    return mt5.order_send(mod_request), p.symbol
+            positions = mt5.positions_get(ticket=ticket)
+            if positions:
+                p = positions[0]
+                mod_request = {
+                    "action": mt5.TRADE_ACTION_SLTP,
+                    "symbol": p.symbol,
+                    "position": p.ticket,
+                    "sl": request.stop_loss or p.sl,
+                    "tp": request.take_profit or p.tp,
+                }
+                return mt5.order_send(mod_request), p.symbol
 
             # Try modifying pending order
-            orders = mt5.orders_get()
-            for o in (orders or []):
-                if str(o.ticket) == request.order_id:
-                    mod_request = {
-                        "action": mt5.TRADE_ACTION_MODIFY,
-                        "order": o.ticket,
-                        "price": request.price or o.price_open,
-                        "sl": request.stop_loss or o.sl,
-                        "tp": request.take_profit or o.tp,
-                    }
-                    return mt5.order_send(mod_request), o.symbol
+            orders = mt5.orders_get(ticket=ticket)
+            if orders:
+                o = orders[0]
+                mod_request = {
+                    "action": mt5.TRADE_ACTION_MODIFY,
+                    "order": o.ticket,
+                    "price": request.price or o.price_open,
+                    "sl": request.stop_loss or o.sl,
+                    "tp": request.take_profit or o.tp,
+                }
+                return mt5.order_send(mod_request), o.symbol
 
             raise ValueError(f"Order/position {request.order_id} not found")
 
@@ -387,14 +550,7 @@ class MT5Adapter(BrokerAdapter):
     async def cancel_order(self, order_id: str) -> bool:
         def _do_cancel():
             ticket = int(order_id)
-            orders = mt5.orders_get()
-            target = None
-            for o in (orders or []):
-                if o.ticket == ticket:
-                    target = o
-                    break
-
-            if not target:
+            if not mt5.orders_get(ticket=ticket):
                 return False
 
             request = {
@@ -415,6 +571,7 @@ class MT5Adapter(BrokerAdapter):
         if raw is None:
             return []
 
+        fts, utc = datetime.fromtimestamp, timezone.utc
         orders: list[Order] = []
         for o in raw:
             # Map MT5 order types
@@ -437,7 +594,7 @@ class MT5Adapter(BrokerAdapter):
                 stop_loss=o.sl if o.sl > 0 else None,
                 take_profit=o.tp if o.tp > 0 else None,
                 status=OrderStatus.PENDING,
-                created_time=datetime.fromtimestamp(o.time_setup, tz=timezone.utc),
+                created_time=fts(o.time_setup, utc),
             ))
 
         return orders
@@ -452,13 +609,8 @@ class MT5Adapter(BrokerAdapter):
             return all_symbols
 
         raw = await self._run(_do_get)
-        symbols: list[SymbolInfo] = []
-
-        for s in raw:
-            if not s.visible:
-                continue
-
-            symbols.append(SymbolInfo(
+        return [
+            SymbolInfo(
                 symbol=s.name,
                 display_name=s.description or s.name,
                 base_currency=s.currency_base,
@@ -470,9 +622,10 @@ class MT5Adapter(BrokerAdapter):
                 margin_rate=0,
                 tradeable=s.trade_mode > 0,
                 asset_class=_classify_mt5_symbol(s),
-            ))
-
-        return symbols
+            )
+            for s in raw
+            if s.visible
+        ]
 
     async def get_candles(
         self,
@@ -482,7 +635,7 @@ class MT5Adapter(BrokerAdapter):
         from_time: Optional[datetime] = None,
         to_time: Optional[datetime] = None,
     ) -> list[Candle]:
-        tf = _TF_MAP.get(timeframe, mt5.TIMEFRAME_H1 if _MT5_AVAILABLE else 0)
+        tf = _TF_MAP.get(timeframe, _TF_DEFAULT)
 
         def _do_get():
             if from_time:
@@ -495,18 +648,14 @@ class MT5Adapter(BrokerAdapter):
         if raw is None:
             return []
 
-        candles: list[Candle] = []
-        for r in raw:
-            candles.append(Candle(
-                timestamp=datetime.fromtimestamp(r['time'], tz=timezone.utc),
-                open=float(r['open']),
-                high=float(r['high']),
-                low=float(r['low']),
-                close=float(r['close']),
-                volume=float(r['tick_volume']),
-            ))
-
-        return candles
+        fts, utc = datetime.fromtimestamp, timezone.utc
+        return [
+            Candle(
+                timestamp=fts(t, utc),
+                open=o, high=h, low=l, close=c, volume=v,
+            )
+            for t, o, h, l, c, v in zip(*_rate_columns(raw))
+        ]
 
     async def get_price(self, symbol: str) -> PriceTick:
         def _do_get():
@@ -534,7 +683,7 @@ class MT5Adapter(BrokerAdapter):
         Get historical bars for chart initialization.
         Returns list of { time, open, high, low, close, volume } dicts.
         """
-        tf = _TF_MAP.get(timeframe, mt5.TIMEFRAME_H1 if _MT5_AVAILABLE else 0)
+        tf = _TF_MAP.get(timeframe, _TF_DEFAULT)
 
         def _do_get():
             mt5.symbol_select(symbol, True)
@@ -545,45 +694,108 @@ class MT5Adapter(BrokerAdapter):
         if raw is None:
             return []
 
-        bars = []
-        for r in raw:
-            bars.append({
-                "time": int(r['time']),
-                "open": float(r['open']),
-                "high": float(r['high']),
-                "low": float(r['low']),
-                "close": float(r['close']),
-                "volume": float(r['tick_volume']),
-            })
-        return bars
+        return [
+            dict(zip(_BAR_KEYS, row)) for row in zip(*_rate_columns(raw))
+        ]
 
     # ── Streaming ─────────────────────────────────────
 
     async def stream_prices(self, symbols: list[str]) -> AsyncGenerator[PriceTick, None]:
-        """Poll MT5 ticks every second."""
+        """Poll MT5 ticks every second, all symbols in one worker job per cycle."""
+        try:
+            await self._run(_ensure_visible, symbols)
+        except Exception as e:
+            logger.debug("MT5 symbol_select failed: %s", e)
+
+        fts, utc = datetime.fromtimestamp, timezone.utc
+        loop = asyncio.get_running_loop()
         while True:
-            for sym in symbols:
-                try:
-                    tick = await self.get_price(sym)
-                    yield tick
-                except Exception:
-                    pass
-            await asyncio.sleep(1)
+            # Pace from the start of the cycle so poll time doesn't add drift
+            next_poll = loop.time() + 1.0
+            try:
+                ticks = await self._run(_poll_ticks_sync, symbols)
+            except Exception as e:
+                logger.debug("MT5 tick poll failed: %s", e)
+                ticks = []
+            for sym, tick in ticks:
+                yield PriceTick(
+                    symbol=sym,
+                    bid=tick.bid,
+                    ask=tick.ask,
+                    timestamp=fts(tick.time, utc),
+                    spread=tick.ask - tick.bid,
+                )
+            await asyncio.sleep(max(0.0, next_poll - loop.time()))
+
+
+_BAR_KEYS = ("time", "open", "high", "low", "close", "volume")
+
+
+def _rate_columns(raw) -> tuple[list, ...]:
+    """Split an MT5 rates structured array into plain Python columns.
+
+    Each column is converted in one numpy call (int seconds for time,
+    float for OHLC and tick volume) instead of per-row field access.
+    """
+    return (
+        raw["time"].astype("i8").tolist(),
+        raw["open"].astype("f8", copy=False).tolist(),
+        raw["high"].astype("f8", copy=False).tolist(),
+        raw["low"].astype("f8", copy=False).tolist(),
+        raw["close"].astype("f8", copy=False).tolist(),
+        raw["tick_volume"].astype("f8").tolist(),
+    )
+
+
+def _ensure_visible(symbols: list[str]) -> None:
+    """Add symbols to Market Watch so symbol_info_tick returns data."""
+    for sym in symbols:
+        mt5.symbol_select(sym, True)
+
+
+def _poll_ticks_sync(symbols: list[str]) -> list[tuple]:
+    """Fetch the latest tick for every symbol inside one worker thread.
+
+    Symbols with no tick data (or that raise) are skipped.
+    """
+    ticks = []
+    for sym in symbols:
+        try:
+            tick = mt5.symbol_info_tick(sym)
+        except Exception:
+            continue
+        if tick is not None:
+            ticks.append((sym, tick))
+    return ticks
+
+
+# (path substring, asset class), checked in order — first match wins
+_ASSET_CLASS_RULES = (
+    ("forex", "forex"), ("fx", "forex"),
+    ("crypto", "crypto"),
+    ("indices", "index"), ("index", "index"),
+    ("commodit", "commodity"), ("metal", "commodity"),
+    ("stock", "stock"), ("equit", "stock"),
+    ("future", "futures"),
+)
+
+
+# Exact match on the top-level path folder (e.g. "Forex\Majors" → "forex")
+_CLASS_MAP = {
+    "forex": "forex", "fx": "forex",
+    "crypto": "crypto",
+    "indices": "index", "index": "index",
+    "metals": "commodity", "commodities": "commodity",
+    "stocks": "stock", "equities": "stock",
+    "futures": "futures",
+}
 
 
 def _classify_mt5_symbol(s) -> str:
     """Attempt to classify an MT5 symbol into an asset class."""
     path = (s.path or "").lower()
-    if "forex" in path or "fx" in path:
-        return "forex"
-    elif "crypto" in path:
-        return "crypto"
-    elif "indices" in path or "index" in path:
-        return "index"
-    elif "commodit" in path or "metal" in path:
-        return "commodity"
-    elif "stock" in path or "equit" in path:
-        return "stock"
-    elif "future" in path:
-        return "futures"
-    return "other"
+    label = _CLASS_MAP.get(path.split("\\", 1)[0])
+    if label:
+        return label
+    # Broker-specific folder names: fall back to substring rules
+    return next((label for sub, label in _ASSET_CLASS_RULES if sub in path), "other")
@@ -5,9 +5,13 @@ Uses the httpx library for async HTTP.  No third-party Oanda SDK required.
 """
 
 import asyncio
+import functools
+import importlib.util
 import json
 import logging
+import time
 from datetime import datetime, timezone
+from decimal import Decimal, ROUND_DOWN
 from typing import Optional, AsyncGenerator
 
 import httpx
@@ -30,6 +34,18 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional: several times faster than the stdlib on the small
+# PRICE lines of the stream and on REST responses.  Falls back to json.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
 
 # ── Timeframe mapping ─────────────────────────────────
 
@@ -41,6 +57,16 @@ _TF_MAP = {
     "1h": "H1", "4h": "H4", "1d": "D", "1w": "W",
 }
 
+# Every native v20 granularity maps to itself, so get_candles resolves
+# both our names and Oanda's with one lookup
+_GRANULARITIES = (
+    "S5", "S10", "S15", "S30",
+    "M1", "M2", "M4", "M5", "M10", "M15", "M30",
+    "H1", "H2", "H3", "H4", "H6", "H8", "H12",
+    "D", "W", "M",
+)
+_TF_MAP_FULL: dict[str, str] = {**{g: g for g in _GRANULARITIES}, **_TF_MAP}
+
 # Common symbol aliases → Oanda instrument format
 _SYMBOL_ALIASES: dict[str, str] = {
     "XAUUSD": "XAU_USD", "XAGUSD": "XAG_USD",
@@ -60,9 +86,30 @@ _DEFAULT_PRECISION: dict[str, int] = {
     "WHEAT_USD": 1, "CORN_USD": 1, "SUGAR_USD": 4, "SOYBN_USD": 1,
 }
 
+# Shared REST client: keepalive reuse across bursts of small JSON calls, and
+# HTTP/2 multiplexing onto one connection when the h2 extra is installed.
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_STREAM_LIMITS = httpx.Limits(max_keepalive_connections=4)
+
+# Candle responses longer than this are converted in the default executor
+_CANDLES_OFFLOAD = 1000
+
+# Shared read-only default for nested .get() lookups — never mutate
+_EMPTY: dict = {}
 
+# is_connected() trusts any successful REST call made within this window
+_HEALTH_TTL = 5.0
+
+
+@functools.lru_cache(maxsize=512)
 def _to_oanda_instrument(symbol: str) -> str:
-    """Convert any common symbol format to Oanda instrument name."""
+    """Convert any common symbol format to Oanda instrument name.
+
+    Memoised: callers pass the same handful of symbols on every order,
+    price and candle request.
+    """
     if symbol in _SYMBOL_ALIASES:
         return _SYMBOL_ALIASES[symbol]
     if "_" in symbol:
@@ -104,50 +151,58 @@ class OandaAdapter(BrokerAdapter):
         self._practice = practice
         self._base_url = self._PRACTICE_URL if practice else self._LIVE_URL
         self._stream_url = self._PRACTICE_STREAM if practice else self._LIVE_STREAM
+        # Request URL prefixes, joined once (account_id never changes)
+        self._v3_base = self._base_url + "/v3"
+        self._pricing_stream_url = f"{self._stream_url}/v3/accounts/{account_id}/pricing/stream"
         self._client: Optional[httpx.AsyncClient] = None
+        self._stream_client: Optional[httpx.AsyncClient] = None
         self._connected = False
         self._last_error: str = ""
         # Cache: instrument → displayPrecision (fetched from Oanda on first use)
         self._precision_cache: dict[str, int] = {}
-
-    # ── helpers ────────────────────────────────────────
-
-    def _headers(self) -> dict:
-        return {
-            "Authorization": f"Bearer {self._api_key}",
+        # Cache: instrument → tradeUnitsPrecision (0 = whole units only)
+        self._units_precision: dict[str, int] = {}
+        # Cache: id → "trade" | "pending", so modify_order picks the endpoint
+        self._order_kind: dict[str, str] = {}
+        self._last_ok_ts: float = 0.0
+        # Static request headers, built once and set on the clients
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "Accept-Datetime-Format": "RFC3339",
         }
 
+    # ── helpers ────────────────────────────────────────
+
     async def _get(self, path: str, params: dict | None = None) -> dict:
         assert self._client, "Not connected"
         r = await self._client.get(
-            f"{self._base_url}/v3{path}",
+            self._v3_base + path,
             params=params,
-            headers=self._headers(),
         )
         r.raise_for_status()
-        return r.json()
+        self._last_ok_ts = time.monotonic()
+        return _json_loads(r.content)
 
     async def _post(self, path: str, body: dict) -> dict:
         assert self._client, "Not connected"
         r = await self._client.post(
-            f"{self._base_url}/v3{path}",
-            json=body,
-            headers=self._headers(),
+            self._v3_base + path,
+            content=_json_dumps(body),
         )
         r.raise_for_status()
-        return r.json()
+        self._last_ok_ts = time.monotonic()
+        return _json_loads(r.content)
 
     async def _put(self, path: str, body: dict) -> dict:
         assert self._client, "Not connected"
         r = await self._client.put(
-            f"{self._base_url}/v3{path}",
-            json=body,
-            headers=self._headers(),
+            self._v3_base + path,
+            content=_json_dumps(body),
         )
         r.raise_for_status()
-        return r.json()
+        self._last_ok_ts = time.monotonic()
+        return _json_loads(r.content)
 
     @staticmethod
     def _parse_ts(ts_str: str) -> datetime:
@@ -160,7 +215,11 @@ class OandaAdapter(BrokerAdapter):
 
     async def connect(self) -> bool:
         self._last_error = ""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS, http2=_HTTP2,
+            headers=self._headers,
+        )
+        self._get_stream_client()
         env = "practice" if self._practice else "live"
         logger.info("Oanda connecting to %s (%s), account %s", self._base_url, env, self._account_id)
         try:
@@ -169,7 +228,7 @@ class OandaAdapter(BrokerAdapter):
             logger.info("Oanda connected: account %s (%s)", self._account_id, env)
             return True
         except httpx.HTTPStatusError as e:
-            body = e.response.text[:500]
+            body = e.response.content[:500].decode("utf-8", "replace")
             self._last_error = f"HTTP {e.response.status_code} from {env} API: {body}"
             logger.error("Oanda connect HTTP %s (%s): %s", e.response.status_code, env, body)
             self._connected = False
@@ -180,16 +239,34 @@ class OandaAdapter(BrokerAdapter):
             self._connected = False
             return False
 
+    def _get_stream_client(self) -> httpx.AsyncClient:
+        # Long-lived pricing streams get their own unbounded-timeout client,
+        # kept across stream_prices calls so a re-subscribe reuses the
+        # warm connection instead of a fresh DNS + TLS handshake.  Built on
+        # demand so streaming still works without connect().
+        if self._stream_client is None:
+            self._stream_client = httpx.AsyncClient(
+                timeout=None, limits=_STREAM_LIMITS, http2=_HTTP2,
+                headers=self._headers,
+            )
+        return self._stream_client
+
     async def disconnect(self) -> None:
         if self._client:
             await self._client.aclose()
             self._client = None
+        if self._stream_client:
+            await self._stream_client.aclose()
+            self._stream_client = None
         self._connected = False
+        self._last_ok_ts = 0.0
         logger.info("Oanda disconnected")
 
     async def is_connected(self) -> bool:
         if not self._connected or not self._client:
             return False
+        if time.monotonic() - self._last_ok_ts < _HEALTH_TTL:
+            return True
         try:
             await self._get(f"/accounts/{self._account_id}/summary")
             return True
@@ -219,39 +296,30 @@ class OandaAdapter(BrokerAdapter):
 
     async def get_positions(self) -> list[Position]:
         data = await self._get(f"/accounts/{self._account_id}/openPositions")
-        positions: list[Position] = []
 
+        # First pass: pick the open side of each position
+        open_sides: list[tuple[str, PositionSide, float, dict]] = []
         for pos in data.get("positions", []):
-            long_units = float(pos.get("long", {}).get("units", 0))
-            short_units = float(pos.get("short", {}).get("units", 0))
+            long_units = float(pos.get("long", _EMPTY).get("units", 0))
+            short_units = float(pos.get("short", _EMPTY).get("units", 0))
 
             if long_units > 0:
-                side_data = pos["long"]
-                side = PositionSide.LONG
-                size = long_units
+                open_sides.append((pos["instrument"], PositionSide.LONG, long_units, pos["long"]))
             elif short_units < 0:
-                side_data = pos["short"]
-                side = PositionSide.SHORT
-                size = abs(short_units)
-            else:
-                continue
+                open_sides.append((pos["instrument"], PositionSide.SHORT, abs(short_units), pos["short"]))
 
+        # One pricing request for every open instrument
+        mids = await self._get_mid_prices([inst for inst, _, _, _ in open_sides])
+
+        # Rebuild the trade entries from this snapshot so closed trades drop out
+        kinds = {k: v for k, v in self._order_kind.items() if v != "trade"}
+        positions: list[Position] = []
+        for instrument, side, size, side_data in open_sides:
+            for trade_id in side_data.get("tradeIDs", ()):
+                kinds[trade_id] = "trade"
             avg_price = float(side_data.get("averagePrice", 0))
             unrealized = float(side_data.get("unrealizedPL", 0))
 
-            # get current price from pricing endpoint
-            try:
-                price_data = await self._get(
-                    f"/accounts/{self._account_id}/pricing",
-                    params={"instruments": pos["instrument"]},
-                )
-                prices = price_data.get("prices", [{}])
-                current_bid = float(prices[0].get("bids", [{"price": 0}])[0]["price"])
-                current_ask = float(prices[0].get("asks", [{"price": 0}])[0]["price"])
-                current_price = (current_bid + current_ask) / 2
-            except Exception:
-                current_price = avg_price
-
             # extract SL/TP if set
             sl = None
             tp = None
@@ -261,12 +329,12 @@ class OandaAdapter(BrokerAdapter):
                 tp = float(side_data["takeProfitOrder"].get("price", 0))
 
             positions.append(Position(
-                position_id=f"{pos['instrument']}_{side.value}",
-                symbol=pos["instrument"],
+                position_id=f"{instrument}_{side.value}",
+                symbol=instrument,
                 side=side,
                 size=size,
                 entry_price=avg_price,
-                current_price=current_price,
+                current_price=mids.get(instrument, avg_price),
                 unrealized_pnl=unrealized,
                 margin_used=0,
                 open_time=datetime.now(timezone.utc),
@@ -274,8 +342,46 @@ class OandaAdapter(BrokerAdapter):
                 take_profit=tp,
             ))
 
+        self._order_kind = kinds
         return positions
 
+    async def _get_mid_prices(self, instruments: list[str]) -> dict[str, float]:
+        """Mid price per instrument from a single /pricing request.
+
+        Instruments that can't be priced are left out so callers can fall
+        back (e.g. to the position's average price).
+        """
+        if not instruments:
+            return {}
+        path = f"/accounts/{self._account_id}/pricing"
+        try:
+            data = await self._get(path, params={"instruments": ",".join(instruments)})
+            prices = data.get("prices", [])
+        except Exception as e:
+            if len(instruments) == 1:
+                logger.debug("Oanda pricing lookup failed: %s", e)
+                return {}
+            # Batch rejected (e.g. one bad instrument) — price each one concurrently
+            logger.debug("Oanda batched pricing failed, retrying per instrument: %s", e)
+            results = await asyncio.gather(
+                *(self._get(path, params={"instruments": i}) for i in instruments),
+                return_exceptions=True,
+            )
+            prices = [
+                p for r in results if isinstance(r, dict)
+                for p in r.get("prices", [])
+            ]
+
+        mids: dict[str, float] = {}
+        for p in prices:
+            try:
+                bid = float(p["bids"][0]["price"])
+                ask = float(p["asks"][0]["price"])
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            mids[p.get("instrument", "")] = (bid + ask) / 2
+        return mids
+
     async def close_position(self, position_id: str, size: Optional[float] = None) -> Order:
         # position_id is "{instrument}_{LONG|SHORT}"
         parts = position_id.rsplit("_", 1)
@@ -294,7 +400,7 @@ class OandaAdapter(BrokerAdapter):
         )
 
         # parse response
-        related = data.get("longOrderFillTransaction") or data.get("shortOrderFillTransaction", {})
+        related = data.get("longOrderFillTransaction") or data.get("shortOrderFillTransaction", _EMPTY)
         return Order(
             order_id=str(related.get("id", "0")),
             symbol=instrument,
@@ -331,6 +437,7 @@ class OandaAdapter(BrokerAdapter):
             )
             for inst in data.get("instruments", []):
                 if inst.get("name") == instrument:
+                    self._units_precision[instrument] = int(inst.get("tradeUnitsPrecision", 0))
                     prec = int(inst.get("displayPrecision", 5))
                     self._precision_cache[instrument] = prec
                     return prec
@@ -346,6 +453,25 @@ class OandaAdapter(BrokerAdapter):
         """Format a price to the correct decimal places for Oanda."""
         return f"{price:.{precision}f}"
 
+    def _fmt_units(self, instrument: str, units: float) -> str:
+        """Format order units to the instrument's tradeUnitsPrecision.
+
+        Instruments not seen yet (no get_symbols / precision lookup) keep the
+        old whole-number-if-integral formatting.  Raises ValueError when
+        units don't fit the precision — size is never rounded.
+        """
+        prec = self._units_precision.get(instrument)
+        if prec is None:
+            return str(int(units)) if units == int(units) else str(units)
+        exact = Decimal(str(units))
+        quantized = exact.quantize(Decimal(1).scaleb(-prec), rounding=ROUND_DOWN)
+        if quantized != exact or not quantized:
+            raise ValueError(
+                f"Order size {abs(units)} is not a valid {instrument} size "
+                f"(units precision {prec})"
+            )
+        return str(quantized)
+
     async def place_order(self, request: OrderRequest) -> Order:
         oanda_instrument = _to_oanda_instrument(request.symbol)
         precision = await self._get_precision(oanda_instrument)
@@ -356,7 +482,7 @@ class OandaAdapter(BrokerAdapter):
         order_body: dict = {
             "type": request.order_type.value,
             "instrument": oanda_instrument,
-            "units": str(int(units)) if units == int(units) else str(units),
+            "units": self._fmt_units(oanda_instrument, units),
             "timeInForce": "FOK" if request.order_type == OrderType.MARKET else "GTC",
         }
 
@@ -383,14 +509,16 @@ class OandaAdapter(BrokerAdapter):
         )
 
         # Market orders fill immediately
-        fill_tx = data.get("orderFillTransaction", {})
-        create_tx = data.get("orderCreateTransaction", {})
+        fill_tx = data.get("orderFillTransaction", _EMPTY)
+        create_tx = data.get("orderCreateTransaction", _EMPTY)
         tx = fill_tx or create_tx
 
         status = OrderStatus.FILLED if fill_tx else OrderStatus.PENDING
+        if not fill_tx and "id" in create_tx:
+            self._order_kind[str(create_tx["id"])] = "pending"
 
         return Order(
-            order_id=str(tx.get("id", data.get("orderCreateTransaction", {}).get("id", "0"))),
+            order_id=str(tx.get("id", create_tx.get("id", "0"))),
             symbol=oanda_instrument,
             side=request.side,
             order_type=request.order_type,
@@ -405,7 +533,19 @@ class OandaAdapter(BrokerAdapter):
         )
 
     async def modify_order(self, request: OrderModifyRequest) -> Order:
-        # Try modifying as a trade (position) SL/TP first
+        # Ids seen in get_positions / get_open_orders go straight to the
+        # right endpoint; unknown ids try trade SL/TP first, then pending order
+        kind = self._order_kind.get(request.order_id)
+        if kind == "pending":
+            return await self._modify_pending_order(request)
+        if kind == "trade":
+            return await self._modify_trade(request)
+        try:
+            return await self._modify_trade(request)
+        except httpx.HTTPStatusError:
+            return await self._modify_pending_order(request)
+
+    async def _modify_trade(self, request: OrderModifyRequest) -> Order:
         body: dict = {}
         if request.stop_loss is not None:
             body["stopLoss"] = {"price": str(request.stop_loss)}
@@ -414,48 +554,45 @@ class OandaAdapter(BrokerAdapter):
         if request.trailing_stop_distance is not None:
             body["trailingStopLoss"] = {"distance": str(request.trailing_stop_distance)}
 
-        try:
-            # Try as trade modification
-            data = await self._put(
-                f"/accounts/{self._account_id}/trades/{request.order_id}/orders",
-                body,
-            )
-            return Order(
-                order_id=request.order_id,
-                symbol="",
-                side=OrderSide.BUY,
-                order_type=OrderType.MARKET,
-                size=0,
-                stop_loss=request.stop_loss,
-                take_profit=request.take_profit,
-                status=OrderStatus.PENDING,
-            )
-        except httpx.HTTPStatusError:
-            # Try as pending order modification
-            order_body: dict = {}
-            if request.price is not None:
-                order_body["price"] = str(request.price)
-            if request.stop_loss is not None:
-                order_body["stopLossOnFill"] = {"price": str(request.stop_loss)}
-            if request.take_profit is not None:
-                order_body["takeProfitOnFill"] = {"price": str(request.take_profit)}
-
-            data = await self._put(
-                f"/accounts/{self._account_id}/orders/{request.order_id}",
-                {"order": order_body},
-            )
+        await self._put(
+            f"/accounts/{self._account_id}/trades/{request.order_id}/orders",
+            body,
+        )
+        return Order(
+            order_id=request.order_id,
+            symbol="",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            size=0,
+            stop_loss=request.stop_loss,
+            take_profit=request.take_profit,
+            status=OrderStatus.PENDING,
+        )
 
-            return Order(
-                order_id=request.order_id,
-                symbol="",
-                side=OrderSide.BUY,
-                order_type=OrderType.LIMIT,
-                size=0,
-                price=request.price,
-                stop_loss=request.stop_loss,
-                take_profit=request.take_profit,
-                status=OrderStatus.PENDING,
-            )
+    async def _modify_pending_order(self, request: OrderModifyRequest) -> Order:
+        order_body: dict = {}
+        if request.price is not None:
+            order_body["price"] = str(request.price)
+        if request.stop_loss is not None:
+            order_body["stopLossOnFill"] = {"price": str(request.stop_loss)}
+        if request.take_profit is not None:
+            order_body["takeProfitOnFill"] = {"price": str(request.take_profit)}
+
+        await self._put(
+            f"/accounts/{self._account_id}/orders/{request.order_id}",
+            {"order": order_body},
+        )
+        return Order(
+            order_id=request.order_id,
+            symbol="",
+            side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            size=0,
+            price=request.price,
+            stop_loss=request.stop_loss,
+            take_profit=request.take_profit,
+            status=OrderStatus.PENDING,
+        )
 
     async def cancel_order(self, order_id: str) -> bool:
         try:
@@ -463,6 +600,7 @@ class OandaAdapter(BrokerAdapter):
                 f"/accounts/{self._account_id}/orders/{order_id}/cancel",
                 {},
             )
+            self._order_kind.pop(order_id, None)
             return True
         except Exception as e:
             logger.error("Cancel order %s failed: %s", order_id, e)
@@ -471,8 +609,13 @@ class OandaAdapter(BrokerAdapter):
     async def get_open_orders(self) -> list[Order]:
         data = await self._get(f"/accounts/{self._account_id}/pendingOrders")
         orders: list[Order] = []
+        # Rebuild the pending entries from this snapshot so filled or
+        # cancelled orders drop out
+        kinds = {k: v for k, v in self._order_kind.items() if v != "pending"}
 
         for o in data.get("orders", []):
+            if o.get("id"):
+                kinds[o["id"]] = "pending"
             side = OrderSide.BUY if float(o.get("units", 0)) > 0 else OrderSide.SELL
 
             otype_str = o.get("type", "MARKET").upper()
@@ -504,6 +647,7 @@ class OandaAdapter(BrokerAdapter):
                 created_time=self._parse_ts(o.get("createTime", "")),
             ))
 
+        self._order_kind = kinds
         return orders
 
     # ── Market Data ────────────────────────────────────
@@ -526,6 +670,7 @@ class OandaAdapter(BrokerAdapter):
 
             # Parse currency pair
             name = inst.get("name", "")
+            self._units_precision[name] = int(inst.get("tradeUnitsPrecision", 0))
             parts = name.split("_")
             base = parts[0] if len(parts) > 1 else name
             quote = parts[1] if len(parts) > 1 else "USD"
@@ -554,8 +699,29 @@ class OandaAdapter(BrokerAdapter):
         from_time: Optional[datetime] = None,
         to_time: Optional[datetime] = None,
     ) -> list[Candle]:
+        path, params = self._candles_request(symbol, timeframe, count, from_time, to_time)
+        data = await self._get(path, params=params)
+
+        raw = data.get("candles", [])
+        if len(raw) > _CANDLES_OFFLOAD:
+            # Thousands of float/timestamp conversions — keep them off the loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _build_candles, raw)
+        return _build_candles(raw)
+
+    @staticmethod
+    def _candles_request(
+        symbol: str,
+        timeframe: str,
+        count: int,
+        from_time: Optional[datetime],
+        to_time: Optional[datetime],
+    ) -> tuple[str, dict]:
         instrument = _to_oanda_instrument(symbol)
-        gran = _TF_MAP.get(timeframe, timeframe)
+        try:
+            gran = _TF_MAP_FULL[timeframe]
+        except KeyError:
+            gran = timeframe
 
         params: dict = {
             "granularity": gran,
@@ -567,47 +733,22 @@ class OandaAdapter(BrokerAdapter):
             params.pop("count", None)
         if to_time:
             params["to"] = to_time.isoformat()
-
-        data = await self._get(
-            f"/instruments/{instrument}/candles",
-            params=params,
-        )
-
-        candles: list[Candle] = []
-        for c in data.get("candles", []):
-            if not c.get("complete", True) and len(data.get("candles", [])) > 1:
-                continue  # skip incomplete candle unless it's the only one
-            mid = c.get("mid", {})
-            candles.append(Candle(
-                timestamp=self._parse_ts(c.get("time", "")),
-                open=float(mid.get("o", 0)),
-                high=float(mid.get("h", 0)),
-                low=float(mid.get("l", 0)),
-                close=float(mid.get("c", 0)),
-                volume=float(c.get("volume", 0)),
-            ))
-
-        return candles
+        return f"/instruments/{instrument}/candles", params
 
     async def get_initial_bars(self, symbol: str, timeframe: str, count: int = 500) -> list[dict]:
         """Return the last `count` bars as plain dicts (for agent warmup).
 
-        Convenience wrapper around get_candles() so the agent engine
-        can call the same method name on all adapters.
+        Same request as get_candles(), but the dicts are built straight
+        from the response so no Candle objects are created in between.
         """
         try:
-            candles = await self.get_candles(symbol, timeframe, count)
-            return [
-                {
-                    "time": int(c.timestamp.timestamp()),
-                    "open": c.open,
-                    "high": c.high,
-                    "low": c.low,
-                    "close": c.close,
-                    "volume": c.volume,
-                }
-                for c in candles
-            ]
+            path, params = self._candles_request(symbol, timeframe, count, None, None)
+            data = await self._get(path, params=params)
+            raw = data.get("candles", [])
+            if len(raw) > _CANDLES_OFFLOAD:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, _build_bars, raw)
+            return _build_bars(raw)
         except Exception as e:
             logger.warning("get_initial_bars(%s, %s, %d) failed: %s", symbol, timeframe, count, e)
             return []
@@ -623,8 +764,8 @@ class OandaAdapter(BrokerAdapter):
             raise ValueError(f"No price data for {symbol}")
 
         p = prices[0]
-        bid = float(p.get("bids", [{"price": 0}])[0]["price"])
-        ask = float(p.get("asks", [{"price": 0}])[0]["price"])
+        bid = _first_price(p, "bids")
+        ask = _first_price(p, "asks")
 
         return PriceTick(
             symbol=instrument,
@@ -687,32 +828,105 @@ class OandaAdapter(BrokerAdapter):
     # ── Streaming ──────────────────────────────────────
 
     async def stream_prices(self, symbols: list[str]) -> AsyncGenerator[PriceTick, None]:
+        async for tick in self.stream_price_tuples(symbols):
+            yield PriceTick(*tick)
+
+    async def stream_price_tuples(
+        self, symbols: list[str],
+    ) -> AsyncGenerator[tuple[str, float, float, datetime, float], None]:
+        """Like stream_prices, but yields bare ``(symbol, bid, ask, time, spread)``
+        tuples for pass-through consumers (ring buffers, websocket rebroadcast)
+        that don't need a PriceTick per tick.
+        """
         instruments = ",".join(_to_oanda_instrument(s) for s in symbols)
-        url = f"{self._stream_url}/v3/accounts/{self._account_id}/pricing/stream"
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream(
-                "GET",
-                url,
-                params={"instruments": instruments},
-                headers=self._headers(),
-            ) as response:
-                async for line in response.aiter_lines():
+
+        async with self._get_stream_client().stream(
+            "GET",
+            self._pricing_stream_url,
+            params={"instruments": instruments},
+        ) as response:
+            # Split raw bytes on newlines and hand each line straight to
+            # the JSON decoder — no str decode / re-encode per tick.
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf += chunk
+                start = 0
+                while (nl := buf.find(b"\n", start)) >= 0:
+                    line = bytes(buf[start:nl])
+                    start = nl + 1
                     if not line.strip():
                         continue
                     try:
-                        data = json.loads(line)
-                        if data.get("type") == "PRICE":
-                            bids = data.get("bids", [])
-                            asks = data.get("asks", [])
-                            bid = float(bids[0]["price"]) if bids else 0
-                            ask = float(asks[0]["price"]) if asks else 0
-                            yield PriceTick(
-                                symbol=data.get("instrument", ""),
-                                bid=bid,
-                                ask=ask,
-                                timestamp=self._parse_ts(data.get("time", "")),
-                                spread=ask - bid,
-                            )
-                    except (json.JSONDecodeError, KeyError, IndexError):
+                        tick = _decode_price_line(line)
+                    except (ValueError, KeyError, IndexError):
                         continue
+                    if tick is not None:
+                        yield tick
+                del buf[:start]
+
+
+def _build_candles(raw: list[dict]) -> list[Candle]:
+    """Candles from a v20 ``candles`` array, dropping incomplete ones unless
+    that is all there is."""
+    keep_incomplete = len(raw) <= 1
+    parse_ts = OandaAdapter._parse_ts
+    return [
+        Candle(
+            timestamp=parse_ts(c.get("time", "")),
+            open=float(mid.get("o", 0)),
+            high=float(mid.get("h", 0)),
+            low=float(mid.get("l", 0)),
+            close=float(mid.get("c", 0)),
+            volume=float(c.get("volume", 0)),
+        )
+        for c in raw
+        if keep_incomplete or c.get("complete", True)
+        for mid in (c.get("mid", _EMPTY),)
+    ]
+
+
+def _build_bars(raw: list[dict]) -> list[dict]:
+    """Like _build_candles, but plain bar dicts with an epoch-seconds time."""
+    keep_incomplete = len(raw) <= 1
+    parse_ts = OandaAdapter._parse_ts
+    return [
+        {
+            "time": int(parse_ts(c.get("time", "")).timestamp()),
+            "open": float(mid.get("o", 0)),
+            "high": float(mid.get("h", 0)),
+            "low": float(mid.get("l", 0)),
+            "close": float(mid.get("c", 0)),
+            "volume": float(c.get("volume", 0)),
+        }
+        for c in raw
+        if keep_incomplete or c.get("complete", True)
+        for mid in (c.get("mid", _EMPTY),)
+    ]
+
+
+def _first_price(p: dict, side: str) -> float:
+    """Top-of-book price from a v20 price object's ``bids``/``asks``, 0.0 if absent."""
+    try:
+        return float(p[side][0]["price"])
+    except (KeyError, IndexError, TypeError):
+        return 0.0
+
+
+def _decode_price_line(line: bytes) -> tuple[str, float, float, datetime, float] | None:
+    """Decode one pricing-stream line into ``(symbol, bid, ask, time, spread)``.
+
+    Returns None for non-PRICE messages (heartbeats).  Kept free of adapter
+    state and dataclasses so the per-tick work is a single plain call.
+    """
+    data = _json_loads(line)
+    if data.get("type") != "PRICE":
+        return None
+    bid = _first_price(data, "bids")
+    ask = _first_price(data, "asks")
+    return (
+        data.get("instrument", ""),
+        bid,
+        ask,
+        OandaAdapter._parse_ts(data.get("time", "")),
+        ask - bid,
+    )
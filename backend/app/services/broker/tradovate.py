@@ -8,6 +8,7 @@ Docs: https://api.tradovate.com
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
 import time
@@ -42,6 +43,12 @@ _TF_MAP = {
     "1h": 60, "4h": 240, "1d": 1440,
 }
 
+# Shared REST client: a warm keepalive pool for order / position / quote
+# bursts, multiplexed over HTTP/2 when the h2 extra is installed.
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 class TradovateAdapter(BrokerAdapter):
     """
@@ -86,6 +93,7 @@ class TradovateAdapter(BrokerAdapter):
         self._client: Optional[httpx.AsyncClient] = None
         self._access_token: Optional[str] = None
         self._token_expiry: float = 0
+        self._auth_lock = asyncio.Lock()
         self._connected = False
         self._account_id: Optional[int] = None
         self._account_spec: Optional[str] = None
@@ -106,10 +114,7 @@ class TradovateAdapter(BrokerAdapter):
         }
 
         try:
-            r = await self._client.post(
-                f"{self._base_url}/auth/accesstokenrequest",
-                json=body,
-            )
+            r = await self._client.post("/auth/accesstokenrequest", json=body)
             r.raise_for_status()
             data = r.json()
 
@@ -135,21 +140,27 @@ class TradovateAdapter(BrokerAdapter):
             return False
 
     def _headers(self) -> dict:
-        h = {"Content-Type": "application/json"}
+        # Content-Type is set on the client; only the token varies
         if self._access_token:
-            h["Authorization"] = f"Bearer {self._access_token}"
-        return h
+            return {"Authorization": f"Bearer {self._access_token}"}
+        return {}
 
     async def _ensure_auth(self):
-        """Re-authenticate if token is about to expire."""
+        """Re-authenticate if token is about to expire.
+
+        Concurrent callers (e.g. a gather fan-out) share one token request:
+        the expiry is re-checked under the lock.
+        """
         if time.time() > self._token_expiry - 300:
-            await self._authenticate()
+            async with self._auth_lock:
+                if time.time() > self._token_expiry - 300:
+                    await self._authenticate()
 
     async def _get(self, path: str, params: dict | None = None) -> dict | list:
         assert self._client, "Not connected"
         await self._ensure_auth()
         r = await self._client.get(
-            f"{self._base_url}{path}",
+            path,
             params=params,
             headers=self._headers(),
         )
@@ -160,7 +171,7 @@ class TradovateAdapter(BrokerAdapter):
         assert self._client, "Not connected"
         await self._ensure_auth()
         r = await self._client.post(
-            f"{self._base_url}{path}",
+            path,
             json=body or {},
             headers=self._headers(),
         )
@@ -179,7 +190,11 @@ class TradovateAdapter(BrokerAdapter):
     # ── Connection ────────────────────────────────────
 
     async def connect(self) -> bool:
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS, http2=_HTTP2,
+            headers={"Content-Type": "application/json"},
+        )
         try:
             if not await self._authenticate():
                 self._connected = False
@@ -227,22 +242,23 @@ class TradovateAdapter(BrokerAdapter):
     # ── Account ───────────────────────────────────────
 
     async def get_account_info(self) -> AccountInfo:
-        accounts = await self._get("/account/list")
+        # Independent lookups — one round-trip of wall time instead of three
+        accounts, cash_balances, positions = await asyncio.gather(
+            self._get("/account/list"),
+            self._get("/cashBalance/list"),
+            self._get("/position/list"),
+        )
         if not isinstance(accounts, list) or not accounts:
             raise RuntimeError("No Tradovate accounts")
 
         acct = accounts[0]
 
-        # Get cash balance
-        cash_balances = await self._get("/cashBalance/list")
         balance = 0.0
         for cb in (cash_balances if isinstance(cash_balances, list) else []):
             if cb.get("accountId") == self._account_id:
                 balance = float(cb.get("realizedPnl", 0)) + float(cb.get("cashBalance", 0))
                 break
 
-        # Count positions
-        positions = await self._get("/position/list")
         open_pos = len([
             p for p in (positions if isinstance(positions, list) else [])
             if p.get("netPos", 0) != 0
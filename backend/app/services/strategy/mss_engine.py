@@ -16,6 +16,7 @@ numpy structured arrays from MT5 directly.
 
 import logging
 import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
@@ -117,16 +118,47 @@ class MSSEngine:
     @staticmethod
     def _is_pivot_high(highs: list[float], i: int, lb: int) -> bool:
         """Check if bar i is a pivot high: unique maximum in [i-lb, i+lb]."""
-        window = highs[i - lb: i + lb + 1]
         val = highs[i]
-        return val == max(window) and window.count(val) == 1
+        # Strictly above both sides == max of the window with no tie
+        left = highs[i - lb: i]
+        right = highs[i + 1: i + lb + 1]
+        return (not left or max(left) < val) and (not right or max(right) < val)
 
     @staticmethod
     def _is_pivot_low(lows: list[float], i: int, lb: int) -> bool:
         """Check if bar i is a pivot low: unique minimum in [i-lb, i+lb]."""
-        window = lows[i - lb: i + lb + 1]
         val = lows[i]
-        return val == min(window) and window.count(val) == 1
+        left = lows[i - lb: i]
+        right = lows[i + 1: i + lb + 1]
+        return (not left or min(left) > val) and (not right or min(right) > val)
+
+    @staticmethod
+    def _find_pivots(values: list[float], lb: int, find_max: bool) -> list[bool]:
+        """
+        Flag every bar that is a pivot (unique max for highs, unique min for
+        lows) of its [i-lb, i+lb] window, in one O(N) sweep.
+
+        A monotonic index deque over the sliding window keeps the first
+        occurrence of the extreme at the front; a tie shows up as an equal
+        value in the second slot, so no count() rescan is needed.
+        """
+        sign = 1.0 if find_max else -1.0
+        n = len(values)
+        flags = [False] * n
+        q: deque[int] = deque()
+        for i in range(n):
+            v = sign * values[i]
+            while q and sign * values[q[-1]] < v:
+                q.pop()
+            q.append(i)
+            if i < 2 * lb:
+                continue
+            if q[0] < i - 2 * lb:
+                q.popleft()
+            centre = i - lb
+            if q[0] == centre and (len(q) == 1 or sign * values[q[1]] < sign * values[centre]):
+                flags[centre] = True
+        return flags
 
     # ── Warmup ──────────────────────────────────────────────
 
@@ -147,24 +179,18 @@ class MSSEngine:
         closes = [b["close"] for b in bars]
 
         # Detect all pivots
-        pivot_highs: list[Optional[float]] = [None] * N
-        pivot_lows: list[Optional[float]] = [None] * N
-
-        for i in range(self.swing_lb, N - self.swing_lb):
-            if self._is_pivot_high(highs, i, self.swing_lb):
-                pivot_highs[i] = highs[i]
-            if self._is_pivot_low(lows, i, self.swing_lb):
-                pivot_lows[i] = lows[i]
+        is_pivot_high = self._find_pivots(highs, self.swing_lb, find_max=True)
+        is_pivot_low = self._find_pivots(lows, self.swing_lb, find_max=False)
 
         # Replay all bars to build structure state
         for i in range(self.swing_lb * 2, N):
             pivot_bar = i - self.swing_lb
             if pivot_bar >= 0:
-                if pivot_highs[pivot_bar] is not None:
-                    self.last_high = pivot_highs[pivot_bar]
+                if is_pivot_high[pivot_bar]:
+                    self.last_high = highs[pivot_bar]
                     self.high_active = True
-                if pivot_lows[pivot_bar] is not None:
-                    self.last_low = pivot_lows[pivot_bar]
+                if is_pivot_low[pivot_bar]:
+                    self.last_low = lows[pivot_bar]
                     self.low_active = True
 
             # Breakout detection
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -1437,6 +1438,9 @@ async def startup_event():
     _register_rl_models()
     _remove_incompatible_strategies()  # must run AFTER seeder to catch re-created python strategies
     _recalculate_agent_pnl()
+    # Compile numba backtest kernels in the background (no-op without numba)
+    from app.services.backtest.jit import warmup_kernels
+    asyncio.get_running_loop().run_in_executor(None, warmup_kernels)
     await ws_manager.start()
     try:
         await tick_aggregator.start()
@@ -19,7 +19,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 import pytest
 
-from app.services.backtest.engine import Bar
+from app.services.backtest.engine import Bar, Trade
 from app.services.optimize.engine import (
     OptimizerEngine,
     ParamSpec,
@@ -89,6 +89,27 @@ def _sma_param_specs():
 BARS = _make_bars(300)
 
 
+def _trading_wf_kwargs(**overrides):
+    """Walk-forward arguments whose folds actually trade (MSS on 1500 bars)."""
+    kwargs = dict(
+        bars=_make_bars(1500),
+        strategy_type="mss",
+        strategy_config={"swing_lb": 10},
+        n_folds=3,
+        symbol="XAUUSD",
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _assert_trades(result, train=True):
+    """Guard against fixtures that make parity checks pass trivially."""
+    assert all(w.test_stats["total_trades"] > 0 for w in result.windows)
+    if train:
+        assert all(w.train_stats["total_trades"] > 0 for w in result.windows)
+    assert len(set(result.oos_equity_curve)) > 1
+
+
 # ── 6A: Parallel Execution ──────────────────────────────────────
 
 class TestParallelExecution:
@@ -399,6 +420,81 @@ class TestWalkForwardGeneralisation:
         )
         assert 0 <= result.consistency_score <= 100
 
+    def test_process_pool_matches_sequential(self):
+        """In-sample runs on a process pool should not change any fold result."""
+        from app.services.backtest.walk_forward import walk_forward_backtest, _TRAIN_STATS_CACHE
+
+        kwargs = _trading_wf_kwargs()
+        _TRAIN_STATS_CACHE.clear()
+        seq = walk_forward_backtest(max_workers=1, **kwargs)
+        _assert_trades(seq)
+        _TRAIN_STATS_CACHE.clear()
+        par = walk_forward_backtest(max_workers=2, **kwargs)
+        assert [w.train_stats for w in par.windows] == [w.train_stats for w in seq.windows]
+        assert [w.test_stats for w in par.windows] == [w.test_stats for w in seq.windows]
+        assert par.oos_equity_curve == seq.oos_equity_curve
+
+    def test_train_stats_cached_across_runs(self):
+        """A repeat run over the same data/config should reuse train stats."""
+        from app.services.backtest import walk_forward as wf
+
+        kwargs = _trading_wf_kwargs(max_workers=1)
+        wf._TRAIN_STATS_CACHE.clear()
+        first = wf.walk_forward_backtest(**kwargs)
+        _assert_trades(first)
+        assert len(wf._TRAIN_STATS_CACHE) == len(first.windows)
+
+        calls = []
+        original = wf._train_stats
+        wf._train_stats = lambda *a, **k: calls.append(a) or original(*a, **k)
+        try:
+            second = wf.walk_forward_backtest(**kwargs)
+        finally:
+            wf._train_stats = original
+        assert calls == []
+        assert [w.train_stats for w in second.windows] == [w.train_stats for w in first.windows]
+
+    def test_skip_train_stats(self):
+        """skip_train_stats leaves train_stats empty but keeps OOS results."""
+        from app.services.backtest.walk_forward import walk_forward_backtest
+
+        kwargs = _trading_wf_kwargs(max_workers=1)
+        full = walk_forward_backtest(**kwargs)
+        _assert_trades(full)
+        lean = walk_forward_backtest(skip_train_stats=True, **kwargs)
+        assert all(w.train_stats is None for w in lean.windows)
+        assert [w.test_stats for w in lean.windows] == [w.test_stats for w in full.windows]
+        assert lean.oos_equity_curve == full.oos_equity_curve
+
+    def test_equity_downsample(self):
+        """Downsampled curve keeps every n-th point and the final balance."""
+        from app.services.backtest.walk_forward import walk_forward_backtest
+
+        kwargs = _trading_wf_kwargs(max_workers=1, skip_train_stats=True)
+        full = walk_forward_backtest(**kwargs)
+        _assert_trades(full, train=False)
+        assert full.oos_max_drawdown > 0
+        thin = walk_forward_backtest(equity_downsample=7, **kwargs)
+        assert thin.oos_equity_curve[:-1] == full.oos_equity_curve[::7][:len(thin.oos_equity_curve) - 1]
+        assert thin.oos_equity_curve[-1] == full.oos_equity_curve[-1]
+        assert thin.oos_max_drawdown == full.oos_max_drawdown
+
+    def test_disk_cache_round_trip(self, tmp_path, monkeypatch):
+        """use_cache stores the WFResult and returns it on an identical re-run."""
+        from app.services.backtest import walk_forward as wf
+
+        monkeypatch.setattr(wf, "_WF_CACHE_DIR", tmp_path)
+        kwargs = _trading_wf_kwargs(max_workers=1, use_cache=True)
+        first = wf.walk_forward_backtest(**kwargs)
+        _assert_trades(first)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        monkeypatch.setattr(wf, "_calculate_windows", None)  # would fail if recomputed
+        second = wf.walk_forward_backtest(**kwargs)
+        assert second == first
+        assert isinstance(second.oos_trades[0], Trade)
+        assert isinstance(second.windows[0].fold_metrics, wf.FoldMetrics)
+
     def test_walk_forward_accepts_symbol_param(self):
         """walk_forward_backtest should accept symbol parameter."""
         from app.services.backtest.walk_forward import walk_forward_backtest
@@ -0,0 +1,235 @@
+"""Strategy backtester (MSS / Gold BT) Tests.
+
+Covers:
+  - prepare_bars / BarArrays reuse across calls
+  - backtest_mss_batch matches per-config backtest_mss
+  - _mss_kernel's inline ADR10 matches compute_adr10_series
+  - backtest_mss trades and stats against golden pre-kernel output
+
+Run: python -m pytest test_strategy_backtester.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from app.services.backtest.engine import Bar
+from app.services.backtest.strategy_backtester import (
+    BarArrays,
+    prepare_bars,
+    backtest_mss,
+    backtest_mss_batch,
+    backtest_gold_bt,
+    compute_adr10_series,
+)
+
+
+# ── Shared fixtures ─────────────────────────────────────────────
+
+def _make_bars(n=3000, base=2000.0, seed=7):
+    """Generate synthetic M10 OHLCV bars spanning several days."""
+    import random as _r
+    _r.seed(seed)
+    bars = []
+    price = base
+    for i in range(n):
+        o = price
+        h = o + _r.uniform(0.5, 6)
+        l = o - _r.uniform(0.5, 6)
+        c = o + _r.uniform(-4, 4)
+        bars.append(Bar(
+            time=1700000000 + i * 600,
+            open=o, high=h, low=l, close=c,
+            volume=_r.uniform(100, 1000),
+        ))
+        price = c
+    return bars
+
+
+def _trade_key(t):
+    return (t.entry_bar, t.exit_bar, t.direction, t.exit_reason, t.entry_price, t.exit_price, t.pnl)
+
+
+BARS = _make_bars()
+MSS_CONFIGS = [
+    {"swing_lb": 5},
+    {"swing_lb": 10, "confirm": "wick"},
+    {"swing_lb": 8, "use_pullback": False, "tp1_pct": 30.0, "tp2_pct": 60.0, "sl_pct": 15.0},
+]
+
+
+# Golden MSS results on _make_bars(400, seed=11), recorded from the pre-kernel
+# implementation.  Rows: (entry_bar, exit_bar, direction, exit_reason,
+# entry_price, exit_price, pnl).  Together the configs hit every exit reason;
+# the tight-level config also has bars where SL fires alongside TP1 or TP2,
+# which pins the exit priority.
+GOLDEN_BARS = _make_bars(n=400, seed=11)
+GOLDEN_MSS = [
+    (
+        {"swing_lb": 5},
+        {"net_profit": 83.7, "max_drawdown": 0.0, "win_rate": 100.0, "final_equity": 10083.66, "equity_points": 391},
+        [
+            (28, 29, "short", "TP2", 1992.2321, 1988.2368, 4.00),
+            (56, 57, "long", "TP2", 1988.8944, 1992.8896, 4.00),
+            (72, 73, "long", "TP2", 1993.8964, 1997.8917, 4.00),
+            (85, 86, "long", "TP2", 2004.1823, 2008.1775, 4.00),
+            (122, 123, "long", "TP2", 2019.6157, 2023.6109, 4.00),
+            (149, 150, "long", "TP2", 2029.1756, 2033.1708, 4.00),
+            (186, 187, "long", "TP1", 2037.2454, 2044.0154, 6.77),
+            (208, 209, "long", "TP1", 2042.2958, 2049.0658, 6.77),
+            (225, 227, "short", "TP1", 2036.5486, 2029.7785, 6.77),
+            (265, 266, "short", "TP1", 2027.7489, 2020.9789, 6.77),
+            (276, 277, "long", "TP1", 2031.6440, 2038.4141, 6.77),
+            (298, 299, "short", "TP1", 2033.7050, 2026.9350, 6.77),
+            (322, 324, "short", "TP1", 2026.6485, 2020.2924, 6.36),
+            (336, 337, "short", "TP1", 2023.9489, 2017.5929, 6.36),
+            (349, 350, "short", "TP1", 2013.5514, 2007.1954, 6.36),
+        ],
+    ),
+    (
+        {"swing_lb": 6, "use_pullback": False, "tp1_pct": 30.0, "tp2_pct": 60.0, "sl_pct": 40.0},
+        {"net_profit": 32.52, "max_drawdown": 10.47, "win_rate": 78.57, "final_equity": 10032.55, "equity_points": 389},
+        [
+            (28, 30, "short", "TP1", 1990.7059, 1985.9116, 4.79),
+            (56, 57, "long", "TP1", 1990.4206, 1995.2149, 4.79),
+            (72, 73, "long", "TP1", 1995.4226, 2000.2169, 4.79),
+            (85, 87, "long", "TP1", 2005.7085, 2010.5028, 4.79),
+            (122, 123, "long", "TP1", 2021.1419, 2025.9362, 4.79),
+            (149, 151, "long", "TP1", 2030.7018, 2035.4960, 4.79),
+            (186, 208, "long", "Reversal", 2041.5556, 2049.1402, 7.58),
+            (208, 225, "long", "SL", 2046.6060, 2028.5526, -18.05),
+            (225, 237, "short", "TP1", 2032.2383, 2018.6982, 13.54),
+            (265, 276, "short", "Reversal", 2023.4386, 2037.3887, -13.95),
+            (276, 298, "long", "Reversal", 2035.9543, 2026.9005, -9.05),
+            (298, 322, "short", "Reversal", 2029.3947, 2022.0540, 7.34),
+            (322, 336, "short", "Reversal", 2022.6018, 2018.9415, 3.66),
+            (336, 351, "short", "TP1", 2018.9471, 2006.2350, 12.71),
+        ],
+    ),
+    (
+        {"swing_lb": 6, "use_pullback": False, "tp1_pct": 80.0, "tp2_pct": 60.0, "sl_pct": 40.0},
+        {"net_profit": 12.22, "max_drawdown": 10.47, "win_rate": 61.54, "final_equity": 10012.2, "equity_points": 389},
+        [
+            (28, 33, "short", "TP2", 1990.7059, 1981.1173, 9.59),
+            (56, 59, "long", "SL", 1990.4206, 1984.0282, -6.39),
+            (72, 76, "long", "TP2", 1995.4226, 2005.0112, 9.59),
+            (85, 89, "long", "TP2", 2005.7085, 2015.2970, 9.59),
+            (122, 139, "long", "SL", 2021.1419, 2014.7495, -6.39),
+            (149, 154, "long", "TP2", 2030.7018, 2040.2903, 9.59),
+            (186, 208, "long", "Reversal", 2041.5556, 2049.1402, 7.58),
+            (208, 225, "long", "SL", 2046.6060, 2028.5526, -18.05),
+            (225, 265, "short", "Reversal", 2032.2383, 2023.1321, 9.11),
+            (265, 276, "short", "Reversal", 2023.4386, 2037.3887, -13.95),
+            (276, 298, "long", "Reversal", 2035.9543, 2026.9005, -9.05),
+            (298, 322, "short", "Reversal", 2029.3947, 2022.0540, 7.34),
+            (322, 336, "short", "Reversal", 2022.6018, 2018.9415, 3.66),
+        ],
+    ),
+    (
+        {"swing_lb": 5, "use_pullback": False, "tp1_pct": 2.0, "tp2_pct": 12.0, "sl_pct": 3.0},
+        {"net_profit": 21.89, "max_drawdown": 2.71, "win_rate": 80.0, "final_equity": 10021.86, "equity_points": 391},
+        [
+            (28, 29, "short", "TP2", 1990.7059, 1988.7882, 1.92),
+            (56, 57, "long", "TP2", 1990.4206, 1992.3383, 1.92),
+            (72, 73, "long", "TP2", 1995.4226, 1997.3403, 1.92),
+            (85, 86, "long", "TP2", 2005.7085, 2007.6262, 1.92),
+            (122, 123, "long", "TP2", 2021.1419, 2023.0596, 1.92),
+            (149, 150, "long", "TP2", 2030.7018, 2032.6195, 1.92),
+            (186, 187, "long", "TP1", 2041.5556, 2042.4583, 0.90),
+            (208, 209, "long", "TP2", 2046.6060, 2052.0221, 5.42),
+            (225, 226, "short", "SL", 2032.2383, 2033.5923, -1.35),
+            (265, 266, "short", "SL", 2023.4386, 2024.7926, -1.35),
+            (276, 277, "long", "TP1", 2035.9543, 2036.8570, 0.90),
+            (298, 299, "short", "TP2", 2029.3947, 2023.9787, 5.42),
+            (322, 323, "short", "TP1", 2022.6018, 2021.7543, 0.85),
+            (336, 337, "short", "TP1", 2019.9022, 2019.0548, 0.85),
+            (349, 350, "short", "SL", 2009.5047, 2010.7759, -1.27),
+        ],
+    ),
+]
+
+
+class TestPreparedBars:
+    def test_prepare_bars_columns(self):
+        prepared = prepare_bars(BARS)
+        assert isinstance(prepared, BarArrays)
+        assert len(prepared) == len(BARS)
+        assert prepared.highs[10] == BARS[10].high
+        assert prepared.times[-1] == BARS[-1].time
+
+    def test_mss_prepared_matches_raw(self):
+        prepared = prepare_bars(BARS)
+        for cfg in MSS_CONFIGS:
+            raw = backtest_mss(BARS, cfg)
+            pre = backtest_mss(prepared, cfg)
+            assert raw.total_trades > 0
+            assert [_trade_key(t) for t in raw.trades] == [_trade_key(t) for t in pre.trades]
+            assert raw.equity_curve == pre.equity_curve
+
+    def test_gold_prepared_matches_raw(self):
+        prepared = prepare_bars(BARS)
+        cfg = {"trigger_interval_hours": 1, "box_height": 4.0}
+        raw = backtest_gold_bt(BARS, cfg)
+        pre = backtest_gold_bt(prepared, cfg)
+        assert [_trade_key(t) for t in raw.trades] == [_trade_key(t) for t in pre.trades]
+        assert raw.net_profit == pytest.approx(pre.net_profit)
+
+    def test_mss_too_few_bars(self):
+        result = backtest_mss(BARS[:20], {"swing_lb": 42})
+        assert result.total_trades == 0
+        assert result.total_bars == 20
+
+
+class TestMSSBatch:
+    def test_batch_matches_single(self):
+        results = backtest_mss_batch(BARS, MSS_CONFIGS, max_workers=2)
+        assert len(results) == len(MSS_CONFIGS)
+        for cfg, res in zip(MSS_CONFIGS, results):
+            single = backtest_mss(BARS, cfg)
+            assert [_trade_key(t) for t in res.trades] == [_trade_key(t) for t in single.trades]
+            assert res.max_drawdown == pytest.approx(single.max_drawdown)
+
+    def test_batch_sequential(self):
+        results = backtest_mss_batch(prepare_bars(BARS), MSS_CONFIGS[:1], max_workers=1)
+        assert len(results) == 1
+        assert results[0].total_trades == backtest_mss(BARS, MSS_CONFIGS[0]).total_trades
+
+
+class TestKernelADR:
+    def test_kernel_adr_matches_reference(self):
+        """Without pullback, |entry - SL| = ADR10 * sl_pct / 100 at the entry bar."""
+        adr = compute_adr10_series([{"time": b.time, "high": b.high, "low": b.low} for b in BARS])
+        sl_pct = 20.0
+        result = backtest_mss(BARS, {"swing_lb": 8, "use_pullback": False, "sl_pct": sl_pct})
+        assert result.total_trades > 0
+        assert len({round(adr[t.entry_bar], 6) for t in result.trades}) > 1
+        for t in result.trades:
+            implied = abs(t.entry_price - t.stop_loss) * 100 / sl_pct
+            assert implied == pytest.approx(adr[t.entry_bar], rel=1e-9)
+
+
+class TestMSSGolden:
+    @pytest.mark.parametrize("cfg, stats, rows", GOLDEN_MSS)
+    def test_matches_golden(self, cfg, stats, rows):
+        result = backtest_mss(GOLDEN_BARS, cfg)
+        got = [
+            (t.entry_bar, t.exit_bar, t.direction, t.exit_reason, t.entry_price, t.exit_price, t.pnl)
+            for t in result.trades
+        ]
+        assert len(got) == len(rows)
+        for g, r in zip(got, rows):
+            assert g[:4] == r[:4]
+            assert g[4:] == pytest.approx(r[4:], abs=1e-4)
+        assert result.total_trades == len(rows)
+        assert result.net_profit == pytest.approx(stats["net_profit"], abs=0.005)
+        assert result.max_drawdown == pytest.approx(stats["max_drawdown"], abs=0.005)
+        assert result.win_rate == pytest.approx(stats["win_rate"], abs=0.005)
+        assert result.equity_curve[-1] == pytest.approx(stats["final_equity"], abs=0.005)
+        assert len(result.equity_curve) == stats["equity_points"]
+
+    def test_golden_covers_every_exit_reason(self):
+        reasons = {row[3] for _, _, rows in GOLDEN_MSS for row in rows}
+        assert reasons == {"TP1", "TP2", "SL", "Reversal"}